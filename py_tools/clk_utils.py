@@ -12,13 +12,13 @@ Debug Mode:
 
 import math
 import os
-from typing import Literal
+from typing import Final, Literal
 
 # Default clock frequency for Moku Go (125 MHz)
-DEFAULT_CLK_FREQ_HZ = 125_000_000
+DEFAULT_CLK_FREQ_HZ: Final = 125_000_000
 
 # Maximum value for 32-bit unsigned integer
-MAX_32BIT = 2**32 - 1
+MAX_32BIT: Final = 2**32 - 1
 
 # Debug mode: Scale all timing values for human observation
 # Set via environment variable: export CLK_UTILS_SLOW_MODE=1000
@@ -31,6 +31,41 @@ class CycleCountOverflowError(ValueError):
     pass
 
 
+def _scale_and_check(cycles: int) -> int:
+    """Apply SLOW_MODE_SCALE_FACTOR and validate the 32-bit cycle range."""
+    # Apply slow mode scaling for debugging (makes timing human-observable)
+    cycles = cycles * SLOW_MODE_SCALE_FACTOR
+
+    if cycles > MAX_32BIT:
+        raise CycleCountOverflowError(
+            f"Cycle count {cycles} exceeds 32-bit range (max: {MAX_32BIT})"
+        )
+
+    if cycles < 0:
+        raise ValueError(f"Negative cycle count {cycles} is invalid")
+
+    return cycles
+
+
+def _int_to_cycles(
+    value: int,
+    units_per_second: int,
+    clk_freq_hz: int,
+    round_direction: Literal["up", "down"],
+) -> int:
+    """Exact integer conversion for whole time values (no float rounding).
+
+    The float path can land just below a whole cycle count, e.g.
+    65 us -> 8124.999... -> 8124 at 125 MHz; this returns 8125.
+    """
+    scaled = value * clk_freq_hz
+    if round_direction == "up":
+        cycles = -(-scaled // units_per_second)
+    else:
+        cycles = scaled // units_per_second
+    return _scale_and_check(cycles)
+
+
 def s_to_cycles(
     seconds: float,
     clk_freq_hz: int = DEFAULT_CLK_FREQ_HZ,
@@ -50,6 +85,9 @@ def s_to_cycles(
     Raises:
         CycleCountOverflowError: If result exceeds 32-bit unsigned integer range
     """
+    if isinstance(seconds, int) and isinstance(clk_freq_hz, int):
+        return _int_to_cycles(seconds, 1, clk_freq_hz, round_direction)
+
     cycles_float = seconds * clk_freq_hz
 
     if round_direction == "up":
@@ -57,18 +95,7 @@ def s_to_cycles(
     else:
         cycles = math.floor(cycles_float)
 
-    # Apply slow mode scaling for debugging (makes timing human-observable)
-    cycles = cycles * SLOW_MODE_SCALE_FACTOR
-
-    if cycles > MAX_32BIT:
-        raise CycleCountOverflowError(
-            f"Cycle count {cycles} exceeds 32-bit range (max: {MAX_32BIT})"
-        )
-
-    if cycles < 0:
-        raise ValueError(f"Negative cycle count {cycles} is invalid")
-
-    return cycles
+    return _scale_and_check(cycles)
 
 
 def us_to_cycles(
@@ -90,6 +117,8 @@ def us_to_cycles(
     Raises:
         CycleCountOverflowError: If result exceeds 32-bit unsigned integer range
     """
+    if isinstance(microseconds, int) and isinstance(clk_freq_hz, int):
+        return _int_to_cycles(microseconds, 1_000_000, clk_freq_hz, round_direction)
     seconds = microseconds / 1_000_000
     return s_to_cycles(seconds, clk_freq_hz, round_direction)
 
@@ -113,6 +142,8 @@ def ns_to_cycles(
     Raises:
         CycleCountOverflowError: If result exceeds 32-bit unsigned integer range
     """
+    if isinstance(nanoseconds, int) and isinstance(clk_freq_hz, int):
+        return _int_to_cycles(nanoseconds, 1_000_000_000, clk_freq_hz, round_direction)
     seconds = nanoseconds / 1_000_000_000
     return s_to_cycles(seconds, clk_freq_hz, round_direction)
 
@@ -150,7 +181,7 @@ def cycles_to_us(
     Returns:
         Time in microseconds as float
     """
-    return (cycles / clk_freq_hz) * 1_000_000
+    return cycles * 1_000_000 / clk_freq_hz
 
 
 def cycles_to_ns(
@@ -167,7 +198,7 @@ def cycles_to_ns(
     Returns:
         Time in nanoseconds as float
     """
-    return (cycles / clk_freq_hz) * 1_000_000_000
+    return cycles * 1_000_000_000 / clk_freq_hz
 
 
 def set_slow_mode(scale_factor: int) -> None:
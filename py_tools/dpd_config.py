@@ -15,14 +15,14 @@ Architecture Note:
 All timing values are stored in clock cycles (native format for the FPGA).
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import warnings
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from clk_utils import cycles_to_s, cycles_to_us, cycles_to_ns
 from dpd_constants import CR0, CR1, FSMState, HVS, Platform, DefaultTiming
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DPDConfig:
     """
     Configuration for Demo Probe Driver (DPD) control registers.
@@ -49,6 +49,9 @@ class DPDConfig:
     - CR8[31:0]: Monitor control + threshold (packed)
     - CR9[31:0]: Monitor window start delay (clock cycles)
     - CR10[31:0]: Monitor window duration (clock cycles)
+
+    Instances are immutable (frozen, slotted); derive variants with
+    dataclasses.replace(config, field=value).
     """
 
     # Lifecycle control (CR1[0,1,2])
@@ -85,6 +88,11 @@ class DPDConfig:
     monitor_window_start: int = 0  # clock cycles
     monitor_window_duration: int = 625000  # clock cycles (default: 5μs @ 125MHz)
 
+    # Register values, built on first to_app_regs_tuples() call (not a field
+    # of the config proper: excluded from __init__, repr and comparisons)
+    _app_regs: Optional[Tuple[Tuple[int, int], ...]] = field(
+        default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validate field values after initialization."""
         # Validate 16-bit signed voltages (-32768 to 32767)
@@ -107,12 +115,12 @@ class DPDConfig:
     def _build_cr1(self) -> int:
         """Build CR1: Lifecycle and trigger control bits."""
         return (
-            (1 if self.arm_enable else 0) << CR1.ARM_ENABLE |
-            (1 if self.auto_rearm_enable else 0) << CR1.AUTO_REARM_ENABLE |
-            (1 if self.fault_clear else 0) << CR1.FAULT_CLEAR |
-            (1 if self.sw_trigger_enable else 0) << CR1.SW_TRIGGER_ENABLE |
-            (1 if self.hw_trigger_enable else 0) << CR1.HW_TRIGGER_ENABLE |
-            (1 if self.sw_trigger else 0) << CR1.SW_TRIGGER
+            bool(self.arm_enable) << CR1.ARM_ENABLE |
+            bool(self.auto_rearm_enable) << CR1.AUTO_REARM_ENABLE |
+            bool(self.fault_clear) << CR1.FAULT_CLEAR |
+            bool(self.sw_trigger_enable) << CR1.SW_TRIGGER_ENABLE |
+            bool(self.hw_trigger_enable) << CR1.HW_TRIGGER_ENABLE |
+            bool(self.sw_trigger) << CR1.SW_TRIGGER
         )
 
     def _build_cr2(self) -> int:
@@ -177,18 +185,32 @@ class DPDConfig:
             >>> ctrl.enable_forge()  # CR0 managed separately
             >>> ctrl.set_controls(config.to_app_regs_list())
         """
-        return [
-            {"idx": 1, "value": self._build_cr1()},
-            {"idx": 2, "value": self._build_cr2()},
-            {"idx": 3, "value": self._build_cr3()},
-            {"idx": 4, "value": self._build_cr4()},
-            {"idx": 5, "value": self._build_cr5()},
-            {"idx": 6, "value": self._build_cr6()},
-            {"idx": 7, "value": self._build_cr7()},
-            {"idx": 8, "value": self._build_cr8()},
-            {"idx": 9, "value": self._build_cr9()},
-            {"idx": 10, "value": self._build_cr10()},
-        ]
+        return [{"idx": idx, "value": value} for idx, value in self.to_app_regs_tuples()]
+
+    def to_app_regs_tuples(self) -> List[Tuple[int, int]]:
+        """Convert configuration to (idx, value) pairs for CR1-CR10.
+
+        Same registers as to_app_regs_list(), without the per-register
+        dicts, for callers that unpack straight into set_control().
+
+        Returns:
+            List of (N, V) tuples for CR1-CR10
+        """
+        # Config is frozen, so the registers are built once per instance
+        if self._app_regs is None:
+            object.__setattr__(self, "_app_regs", (
+                (1, self._build_cr1()),
+                (2, self._build_cr2()),
+                (3, self._build_cr3()),
+                (4, self._build_cr4()),
+                (5, self._build_cr5()),
+                (6, self._build_cr6()),
+                (7, self._build_cr7()),
+                (8, self._build_cr8()),
+                (9, self._build_cr9()),
+                (10, self._build_cr10()),
+            ))
+        return list(self._app_regs)
 
     def to_control_regs_list(self) -> List[Dict[str, int]]:
         """DEPRECATED: Use to_app_regs_list() + separate FORGE control.
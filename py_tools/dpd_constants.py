@@ -19,6 +19,10 @@ API Changes from v3.x:
   - Removed sw_trigger_enable and hw_trigger_enable (no longer needed)
 """
 
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+
 # ==============================================================================
 # CR0 - Lifecycle Control ("RUN" + arm/trigger/fault)
 # ==============================================================================
@@ -183,6 +187,11 @@ class HVS:
     V_MAX_MV = 5000       # +/-5000mV range
     DIGITAL_MAX = 32768   # 16-bit signed max
 
+    # Conversion scale factors, computed once here rather than per call
+    _VOLTS_PER_DIGITAL = V_MAX / DIGITAL_MAX
+    _DIGITAL_PER_MV = DIGITAL_MAX / V_MAX_MV
+    _MV_PER_DIGITAL = V_MAX_MV / DIGITAL_MAX
+
     # Digital units per FSM state
     DIGITAL_UNITS_PER_STATE = 3277  # ~0.5V per state @ +/-5V full scale
 
@@ -196,29 +205,39 @@ class HVS:
     VOLTAGE_FIRING       = 9831   # 1.5V
     VOLTAGE_COOLDOWN     = 13108  # 2.0V
 
-    # State-to-voltage map (for oscilloscope observation)
-    STATE_VOLTAGE_MAP = {
+    # State-to-voltage map (for oscilloscope observation), read-only
+    STATE_VOLTAGE_MAP = MappingProxyType({
         "INITIALIZING": 0.0,   # State 0: 0V (transient)
         "IDLE": 0.5,           # State 1: 0.5V
         "ARMED": 1.0,          # State 2: 1.0V
         "FIRING": 1.5,         # State 3: 1.5V
         "COOLDOWN": 2.0,       # State 4: 2.0V
         "FAULT": -0.5,         # Negative voltage indicates fault
-    }
+    })
 
-    # State-to-digital map (for direct digital comparison)
-    STATE_DIGITAL_MAP = {
+    # State-to-digital map (for direct digital comparison), read-only
+    STATE_DIGITAL_MAP = MappingProxyType({
         "INITIALIZING": VOLTAGE_INITIALIZING,
         "IDLE": VOLTAGE_IDLE,
         "ARMED": VOLTAGE_ARMED,
         "FIRING": VOLTAGE_FIRING,
         "COOLDOWN": VOLTAGE_COOLDOWN,
-    }
+    })
+
+    # STATE_VOLTAGE_MAP keyed by FSMState value instead of name
+    _STATE_VOLTAGE = {getattr(FSMState, name): volts for name, volts in STATE_VOLTAGE_MAP.items()}
+
+    # The maps above sorted by level, for bisect-based decoding
+    _DIGITAL_LEVELS = tuple(sorted(STATE_DIGITAL_MAP.values()))
+    _DIGITAL_NAMES = tuple(sorted(STATE_DIGITAL_MAP, key=STATE_DIGITAL_MAP.get))
+    _VOLTAGE_LEVELS = tuple(sorted(v for k, v in STATE_VOLTAGE_MAP.items() if k != "FAULT"))
+    _VOLTAGE_NAMES = tuple(sorted((k for k in STATE_VOLTAGE_MAP if k != "FAULT"),
+                                  key=STATE_VOLTAGE_MAP.get))
 
     @staticmethod
     def digital_to_volts(digital_units: int) -> float:
         """Convert digital units to voltage (V)."""
-        return (digital_units / 32768.0) * 5.0
+        return digital_units * HVS._VOLTS_PER_DIGITAL
 
     @staticmethod
     def volts_to_digital(voltage: float) -> int:
@@ -227,13 +246,38 @@ class HVS:
 
     @staticmethod
     def mv_to_digital(millivolts: float) -> int:
-        """Convert millivolts to 16-bit signed digital value."""
-        return int((millivolts / HVS.V_MAX_MV) * HVS.DIGITAL_MAX)
+        """Convert millivolts to 16-bit signed digital value.
+
+        Whole-mV values in the DAC range come from a lookup table.
+        """
+        if type(millivolts) is int and -HVS.V_MAX_MV <= millivolts <= HVS.V_MAX_MV:
+            return _MV_TO_DIGITAL_LUT[millivolts + HVS.V_MAX_MV]
+        return int(millivolts * HVS._DIGITAL_PER_MV)
 
     @staticmethod
     def digital_to_mv(digital: int) -> float:
         """Convert 16-bit signed digital value to millivolts."""
-        return (digital / HVS.DIGITAL_MAX) * HVS.V_MAX_MV
+        return digital * HVS._MV_PER_DIGITAL
+
+    @staticmethod
+    def digital_to_mv_int(digital: int) -> int:
+        """Convert 16-bit signed digital value to whole millivolts (floored).
+
+        Integer-only counterpart of digital_to_mv() for exact comparisons.
+        """
+        return (digital * HVS.V_MAX_MV) // HVS.DIGITAL_MAX
+
+    @staticmethod
+    def state_voltage(fsm_state: int) -> float:
+        """Expected voltage (V) for an FSMState value, without a name lookup.
+
+        Raises:
+            ValueError: If fsm_state is not a defined FSMState value
+        """
+        try:
+            return HVS._STATE_VOLTAGE[fsm_state]
+        except KeyError:
+            raise ValueError(f"Unknown FSM state: {fsm_state}") from None
 
     @staticmethod
     def state_to_digital(state: int, status_offset: int = 0) -> int:
@@ -245,9 +289,10 @@ class HVS:
         """Decode FSM state name from digital value."""
         if digital < -tolerance:
             return "FAULT"
-        for state_name, expected_digital in HVS.STATE_DIGITAL_MAP.items():
-            if abs(digital - expected_digital) <= tolerance:
-                return state_name
+        # Lowest level >= digital - tolerance, i.e. the first in-range state
+        i = bisect_left(HVS._DIGITAL_LEVELS, digital - tolerance)
+        if i < len(HVS._DIGITAL_LEVELS) and HVS._DIGITAL_LEVELS[i] <= digital + tolerance:
+            return HVS._DIGITAL_NAMES[i]
         return f"UNKNOWN({digital})"
 
     @staticmethod
@@ -255,14 +300,25 @@ class HVS:
         """Decode FSM state name from voltage reading."""
         if voltage < -tolerance:
             return "FAULT"
-        for state_name, expected_voltage in HVS.STATE_VOLTAGE_MAP.items():
-            if state_name == "FAULT":
-                continue
-            if abs(voltage - expected_voltage) < tolerance:
-                return state_name
+        # Bisect only locates the lowest candidate (voltage - tolerance may
+        # round either way); the match itself is the abs() test, lowest first
+        levels = HVS._VOLTAGE_LEVELS
+        for j in range(max(bisect_right(levels, voltage - tolerance) - 1, 0), len(levels)):
+            diff = voltage - levels[j]
+            if abs(diff) < tolerance:
+                return HVS._VOLTAGE_NAMES[j]
+            if diff < 0:
+                break  # Higher levels are only further away
         return f"UNKNOWN({voltage:.3f}V)"
 
 
+# mv_to_digital() results for every whole mV in -V_MAX_MV..+V_MAX_MV, computed
+# with the same float expression so table and fallback agree exactly
+_MV_TO_DIGITAL_LUT = tuple(
+    int(mv * HVS._DIGITAL_PER_MV) for mv in range(-HVS.V_MAX_MV, HVS.V_MAX_MV + 1)
+)
+
+
 # ==============================================================================
 # Platform Constants
 # ==============================================================================
@@ -304,6 +360,7 @@ class DefaultTiming:
 # Helper Functions
 # ==============================================================================
 
+@lru_cache(maxsize=256)  # 7 flags = 128 values, plus call-style variants
 def cr0_build(
     forge_ready: bool = True,
     user_enable: bool = True,
@@ -337,22 +394,16 @@ def cr0_build(
         >>> hex(cr0_build(arm_enable=True, sw_trigger=True))
         '0xe0000005'  # RUN + armed + trigger
     """
-    value = 0
-    if forge_ready:
-        value |= CR0.FORGE_READY_MASK
-    if user_enable:
-        value |= CR0.USER_ENABLE_MASK
-    if clk_enable:
-        value |= CR0.CLK_ENABLE_MASK
-    if campaign_enable:
-        value |= CR0.CAMPAIGN_ENABLE_MASK
-    if arm_enable:
-        value |= CR0.ARM_ENABLE_MASK
-    if fault_clear:
-        value |= CR0.FAULT_CLEAR_MASK
-    if sw_trigger:
-        value |= CR0.SW_TRIGGER_MASK
-    return value
+    # Branchless: each flag contributes bool(flag) at its bit position
+    return (
+        bool(forge_ready) << CR0.FORGE_READY |
+        bool(user_enable) << CR0.USER_ENABLE |
+        bool(clk_enable) << CR0.CLK_ENABLE |
+        bool(campaign_enable) << CR0.CAMPAIGN_ENABLE |
+        bool(arm_enable) << CR0.ARM_ENABLE |
+        bool(fault_clear) << CR0.FAULT_CLEAR |
+        bool(sw_trigger) << CR0.SW_TRIGGER
+    )
 
 
 def cr0_extract(value: int) -> dict:
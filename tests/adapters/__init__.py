@@ -23,6 +23,15 @@ Usage:
     await harness.wait_for_state("ARMED", timeout_us=1000)
 """
 
+import sys
+from pathlib import Path
+
+# tests/ must be importable for `from lib import ...` in the adapter modules.
+# Done once here, for the whole package, rather than in each submodule.
+_TESTS_PATH = str(Path(__file__).parent.parent)
+if _TESTS_PATH not in sys.path:
+    sys.path.insert(0, _TESTS_PATH)
+
 # Base classes (for type hints and subclassing)
 from .base import (
     AsyncFSMController,
@@ -13,27 +13,26 @@ Reference: docs/api-v4.md
 """
 
 from abc import ABC, abstractmethod
-from typing import Tuple, Optional
-
-# Import from lib for constants
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from typing import Dict, Tuple, Optional
 
+# Import from lib for constants (tests/ is put on sys.path by adapters/__init__)
 from lib import (
     Platform,
     HVS,
     CR0,
-    HVS_DIGITAL_INITIALIZING,
-    HVS_DIGITAL_IDLE,
-    HVS_DIGITAL_ARMED,
-    HVS_DIGITAL_FIRING,
-    HVS_DIGITAL_COOLDOWN,
     SIM_HVS_TOLERANCE,
 )
 
 CLK_FREQ_HZ = Platform.CLK_FREQ_HZ
 
+# Fixed CR0 lifecycle bit patterns, folded once for the controller methods
+_CR0_ARM = CR0.ARM_ENABLE_MASK
+_CR0_NOT_ARM = ~CR0.ARM_ENABLE_MASK
+_CR0_ARM_TRIGGER = CR0.ARM_ENABLE_MASK | CR0.SW_TRIGGER_MASK
+_CR0_FAULT_CLEAR = CR0.FAULT_CLEAR_MASK
+
 
 class AsyncFSMController(ABC):
     """Abstract async interface for FSM control register operations.
@@ -50,10 +49,13 @@ class AsyncFSMController(ABC):
     set_control_register() for configuration purposes.
     """
 
+    __slots__ = ("_forge_state", "_lifecycle_state", "_batch")
+
     def __init__(self):
         """Initialize CR0 state tracking."""
         self._forge_state: int = 0      # Tracks CR0[31:29]
         self._lifecycle_state: int = 0  # Tracks CR0[2:0]
+        self._batch: Optional[Dict[int, int]] = None  # Pending writes inside batch()
 
     @abstractmethod
     async def set_control_register(self, reg_num: int, value: int):
@@ -64,6 +66,66 @@ class AsyncFSMController(ABC):
         """
         pass
 
+    async def set_control_registers(self, values: Dict[int, int]):
+        """Set several control registers.
+
+        The default writes them one at a time, in order. Backends that can
+        write a batch in one transaction (e.g. Moku set_controls) override
+        this.
+
+        Args:
+            values: Mapping of register number to value
+        """
+        for reg_num, value in values.items():
+            await self.set_control_register(reg_num, value)
+
+    def _queue_write(self, reg_num: int, value: int) -> bool:
+        """Queue a write if a batch() is open.
+
+        Backends call this first in set_control_register() and return early
+        when it returns True.
+        """
+        if self._batch is None:
+            return False
+        self._batch[reg_num] = value
+        return True
+
+    def _queue_writes(self, values: Dict[int, int]) -> bool:
+        """Queue several writes if a batch() is open.
+
+        Backends that override set_control_registers() call this first and
+        return early when it returns True.
+        """
+        if self._batch is None:
+            return False
+        self._batch.update(values)
+        return True
+
+    @asynccontextmanager
+    async def batch(self):
+        """Coalesce register writes into one set_control_registers() call.
+
+        Writes made inside the block are queued (last value per register
+        wins) and flushed on exit. If the block raises, queued writes are
+        dropped. Nested batch() blocks join the outer batch.
+
+        Example:
+            async with controller.batch():
+                await controller.configure_timing(...)
+                await controller.arm()
+        """
+        if self._batch is not None:
+            yield
+            return
+
+        self._batch = {}
+        try:
+            yield
+            pending = self._batch
+        finally:
+            self._batch = None
+        await self.set_control_registers(pending)
+
     @abstractmethod
     async def get_control_register(self, reg_num: int) -> int:
         """Get a control register value."""
@@ -112,12 +174,12 @@ class AsyncFSMController(ABC):
 
     async def arm(self):
         """Arm FSM (IDLE → ARMED). Sets CR0[2]."""
-        self._lifecycle_state |= CR0.ARM_ENABLE_MASK
+        self._lifecycle_state |= _CR0_ARM
         await self._write_cr0()
 
     async def disarm(self):
         """Disarm FSM (ARMED → IDLE). Clears CR0[2]."""
-        self._lifecycle_state &= ~CR0.ARM_ENABLE_MASK
+        self._lifecycle_state &= _CR0_NOT_ARM
         await self._write_cr0()
 
     async def trigger(self):
@@ -130,17 +192,24 @@ class AsyncFSMController(ABC):
         so no explicit clear is needed.
         """
         # Atomic: FORGE + arm + trigger in one write
-        await self.set_control_register(0,
-            self._forge_state | CR0.ARM_ENABLE_MASK | CR0.SW_TRIGGER_MASK)
+        await self.set_control_register(0, self._forge_state | _CR0_ARM_TRIGGER)
         # RTL auto-clears trigger via edge detection + pulse stretcher
 
+    async def release_trigger(self):
+        """Drop CR0[0] while keeping FORGE + arm.
+
+        The RTL pulse does not depend on this write, but CR0 keeps the
+        trigger bit set until something else is written. Releasing it makes
+        the next trigger() a fresh 0 -> 1 edge.
+        """
+        await self.set_control_register(0, self._forge_state | _CR0_ARM)
+
     async def clear_fault(self):
         """Clear fault state. Edge-triggered with auto-clear.
 
         Transitions FSM: FAULT → INITIALIZING → IDLE
         """
-        await self.set_control_register(0,
-            self._forge_state | CR0.FAULT_CLEAR_MASK)
+        await self.set_control_register(0, self._forge_state | _CR0_FAULT_CLEAR)
         await self.wait_cycles(10)  # Let edge detection capture it
         # After clear, FSM goes to INITIALIZING then IDLE
         self._lifecycle_state = 0  # Reset lifecycle tracking
@@ -151,12 +220,15 @@ class AsyncFSMController(ABC):
 
     async def configure_timing(self, trig_duration: int, intensity_duration: int,
                                 cooldown: int, timeout: Optional[int] = None):
-        """Configure FSM timing registers (CR4, CR5, CR7, optionally CR6)."""
-        await self.set_control_register(4, trig_duration)
-        await self.set_control_register(5, intensity_duration)
-        await self.set_control_register(7, cooldown)
+        """Configure FSM timing registers (CR4, CR5, CR7, optionally CR6).
+
+        The registers are independent, so they go out as one
+        set_control_registers() write.
+        """
+        values = {4: trig_duration, 5: intensity_duration, 7: cooldown}
         if timeout is not None:
-            await self.set_control_register(6, timeout)
+            values[6] = timeout
+        await self.set_control_registers(values)
 
     async def apply_config(self, config):
         """Apply a DPDConfig to registers CR2-CR10.
@@ -167,8 +239,7 @@ class AsyncFSMController(ABC):
         Note: This does not modify CR0 or CR1. Use enable_forge() and arm()
         for lifecycle control.
         """
-        for reg in config.to_app_regs_list():
-            await self.set_control_register(reg["idx"], reg["value"])
+        await self.set_control_registers(dict(config.to_app_regs_tuples()))
 
     # =========================================================================
     # Convenience Methods
@@ -187,6 +258,8 @@ class AsyncFSMController(ABC):
 class AsyncFSMStateReader(ABC):
     """Abstract async interface for reading FSM state."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def read_state_digital(self) -> int:
         """Read OutputC as signed digital value."""
@@ -203,10 +276,25 @@ class AsyncFSMStateReader(ABC):
         state = decode_state_from_digital(digital)
         return state, digital
 
+    async def get_state_and_voltage(self) -> Tuple[str, int, float]:
+        """Get current FSM state, digital value and voltage from one read.
+
+        Equivalent to get_state() followed by read_state_voltage(), without
+        sampling OutputC twice.
+        """
+        digital = await self.read_state_digital()
+        return decode_state_from_digital(digital), digital, HVS.digital_to_volts(digital)
+
 
 class AsyncFSMTestHarness(ABC):
     """Combined async test harness for FSM testing."""
 
+    __slots__ = ()
+
+    # Default wait_for_state() backoff: 1 us, doubling up to 100 us
+    POLL_MIN_CYCLES = 125
+    POLL_MAX_CYCLES = 12_500
+
     @property
     @abstractmethod
     def controller(self) -> AsyncFSMController:
@@ -219,11 +307,33 @@ class AsyncFSMTestHarness(ABC):
         """Get the state reader instance."""
         pass
 
-    @abstractmethod
     async def wait_for_state(self, target_state: str, timeout_us: int = 1000,
                               tolerance: int = SIM_HVS_TOLERANCE) -> bool:
-        """Wait for FSM to reach target state."""
-        pass
+        """Wait for FSM to reach target state.
+
+        Default implementation: polls with exponentially growing intervals
+        (POLL_MIN_CYCLES doubling up to POLL_MAX_CYCLES), since most
+        transitions land within the first few polls. Backends override
+        this with a wait suited to their transport.
+        """
+        target_digital = state_to_digital(target_state)
+        if target_digital is None:
+            raise ValueError(f"Unknown state: {target_state}")
+        low, high = target_digital - tolerance, target_digital + tolerance
+
+        timeout_cycles = int(timeout_us * CLK_FREQ_HZ / 1e6)
+        elapsed = 0
+        step = self.POLL_MIN_CYCLES
+
+        while True:
+            if low <= await self.state_reader.read_state_digital() <= high:
+                return True
+            if elapsed >= timeout_cycles:
+                return False
+            step = min(step, timeout_cycles - elapsed)
+            await self.controller.wait_cycles(step)
+            elapsed += step
+            step = min(step * 2, self.POLL_MAX_CYCLES)
 
     async def assert_state(self, expected_state: str, context: str = "",
                            tolerance: int = SIM_HVS_TOLERANCE):
@@ -241,24 +351,37 @@ class AsyncFSMTestHarness(ABC):
             timing_config: Optional timing config with TRIG_OUT_DURATION,
                           INTENSITY_DURATION, COOLDOWN_INTERVAL attributes
         """
-        if timing_config:
-            await self.controller.configure_timing(
-                trig_duration=timing_config.TRIG_OUT_DURATION,
-                intensity_duration=timing_config.INTENSITY_DURATION,
-                cooldown=timing_config.COOLDOWN_INTERVAL,
-            )
-        await self.controller.arm()
+        async with self.controller.batch():
+            if timing_config:
+                await self.controller.configure_timing(
+                    trig_duration=timing_config.TRIG_OUT_DURATION,
+                    intensity_duration=timing_config.INTENSITY_DURATION,
+                    cooldown=timing_config.COOLDOWN_INTERVAL,
+                )
+            await self.controller.arm()
         await self.controller.wait_cycles(100)
 
     async def software_trigger(self):
         """Issue software trigger. Single atomic write."""
         await self.controller.trigger()
 
+    async def pulse_sw_trigger(self, width: int = 10):
+        """Issue software trigger, then release CR0[0] after width cycles.
+
+        Use this instead of software_trigger() when the test triggers again
+        without any other CR0 write in between.
+
+        Args:
+            width: Clock cycles to hold the trigger bit before releasing it
+        """
+        await self.controller.trigger()
+        await self.controller.wait_cycles(width)
+        await self.controller.release_trigger()
+
     async def reset_to_idle(self, timeout_us: int = 10000) -> bool:
         """Reset FSM to IDLE state via fault_clear."""
         # Clear configuration registers
-        for i in range(2, 11):
-            await self.controller.set_control_register(i, 0)
+        await self.controller.set_control_registers({i: 0 for i in range(2, 11)})
         await self.controller.wait_cycles(100)
 
         # Use fault_clear to transition to IDLE
@@ -272,15 +395,29 @@ class AsyncFSMTestHarness(ABC):
 # =============================================================================
 
 STATE_DIGITAL_MAP = {
-    "INITIALIZING": HVS_DIGITAL_INITIALIZING,
-    "IDLE": HVS_DIGITAL_IDLE,
-    "ARMED": HVS_DIGITAL_ARMED,
-    "FIRING": HVS_DIGITAL_FIRING,
-    "COOLDOWN": HVS_DIGITAL_COOLDOWN,
+    "INITIALIZING": HVS.VOLTAGE_INITIALIZING,
+    "IDLE": HVS.VOLTAGE_IDLE,
+    "ARMED": HVS.VOLTAGE_ARMED,
+    "FIRING": HVS.VOLTAGE_FIRING,
+    "COOLDOWN": HVS.VOLTAGE_COOLDOWN,
 }
 
 STATE_VOLTAGE_MAP = HVS.STATE_VOLTAGE_MAP
 
+# STATE_DIGITAL_MAP sorted by level, for bisect-based decoding
+_DECODE_LEVELS = tuple(sorted(STATE_DIGITAL_MAP.values()))
+_DECODE_NAMES = tuple(sorted(STATE_DIGITAL_MAP, key=STATE_DIGITAL_MAP.get))
+
+# Every digital value within SIM_HVS_TOLERANCE of a state level -> state name,
+# so decoding at the default tolerance is one dict lookup. Levels are
+# DIGITAL_UNITS_PER_STATE apart, far more than 2 * tolerance, so no value
+# falls in two windows and the table agrees with the nearest-level search.
+_DIGITAL_TO_STATE = {
+    level + d: name
+    for level, name in zip(_DECODE_LEVELS, _DECODE_NAMES)
+    for d in range(-SIM_HVS_TOLERANCE, SIM_HVS_TOLERANCE + 1)
+}
+
 
 def state_to_digital(state: str) -> Optional[int]:
     """Convert state name to digital value."""
@@ -293,12 +430,26 @@ def state_to_voltage(state: str) -> Optional[float]:
 
 
 def decode_state_from_digital(digital: int, tolerance: int = SIM_HVS_TOLERANCE) -> str:
-    """Decode FSM state from digital value."""
+    """Decode FSM state from digital value.
+
+    At the default tolerance this is a lookup in a precomputed table.
+    Otherwise it bisects the sorted state levels to find the nearest one,
+    then applies the tolerance check to that single candidate.
+    """
+    if tolerance == SIM_HVS_TOLERANCE:
+        state = _DIGITAL_TO_STATE.get(digital)
+        if state is not None:
+            return state
+
     if digital < -tolerance:
         return "FAULT"
 
-    for name, expected in STATE_DIGITAL_MAP.items():
-        if abs(digital - expected) <= tolerance:
-            return name
+    i = bisect_left(_DECODE_LEVELS, digital)
+    if i == len(_DECODE_LEVELS) or (
+        i > 0 and digital - _DECODE_LEVELS[i - 1] <= _DECODE_LEVELS[i] - digital
+    ):
+        i -= 1
+    if abs(digital - _DECODE_LEVELS[i]) <= tolerance:
+        return _DECODE_NAMES[i]
 
     return "UNKNOWN"
@@ -6,21 +6,32 @@ Provides CocoTB implementation of the unified async interface.
 Supports optional jitter simulation for "train like you fight" testing.
 """
 
-import random
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
 from .base import (
     AsyncFSMController,
     AsyncFSMStateReader,
     AsyncFSMTestHarness,
     state_to_digital,
-    CLK_FREQ_HZ,
 )
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from lib import SIM_HVS_TOLERANCE
+from lib import CR0, SIM_HVS_TOLERANCE, JitterPool
+
+
+def _cocotb_missing(*args, **kwargs):
+    raise RuntimeError("cocotb is required for the CocoTB adapter")
+
+
+# Resolved once at import. The hardware runner imports this package without
+# cocotb installed, so missing names become stand-ins that raise on use.
+try:
+    from cocotb import start_soon
+    from cocotb.triggers import ClockCycles, SimTimeoutError, with_timeout
+except ImportError:
+    start_soon = ClockCycles = with_timeout = _cocotb_missing
+
+    class SimTimeoutError(Exception):
+        """Stand-in so except clauses resolve; never raised without cocotb."""
 
 
 class CocoTBAsyncController(AsyncFSMController):
@@ -30,52 +41,70 @@ class CocoTBAsyncController(AsyncFSMController):
     clock cycles to simulate network propagation delays.
     """
 
+    __slots__ = ("dut", "jitter_enabled", "jitter_range", "_jitter", "_ctrl")
+
     def __init__(self, dut, jitter_enabled: bool = False,
-                 jitter_range: Tuple[int, int] = (10, 200)):
+                 jitter_range: Tuple[int, int] = (10, 200),
+                 seed: Optional[int] = None):
         """Initialize with CocoTB DUT.
 
         Args:
             dut: CocoTB DUT object
             jitter_enabled: Add random delays to register writes
             jitter_range: (min_cycles, max_cycles) for jitter delays
+            seed: Seed for the jitter RNG (None = module-level random,
+                  seeded by cocotb from RANDOM_SEED)
         """
         super().__init__()  # Initialize _forge_state and _lifecycle_state
         self.dut = dut
         self.jitter_enabled = jitter_enabled
         self.jitter_range = jitter_range
-        self._clock_cycles = None
+        self._jitter = JitterPool(seed)
+        # Control0-Control15 signal handles, resolved once (None if absent)
+        self._ctrl = [getattr(dut, f"Control{i}", None) for i in range(16)]
+
+    def _ctrl_signal(self, reg_num: int):
+        """Cached Control{reg_num} handle, or ValueError if not on the DUT."""
+        ctrl_signal = self._ctrl[reg_num] if 0 <= reg_num < len(self._ctrl) else None
+        if ctrl_signal is None:
+            raise ValueError(f"Control register {reg_num} not found on DUT")
+        return ctrl_signal
 
-    def _get_clock_cycles(self):
-        """Lazy import of ClockCycles."""
-        if self._clock_cycles is None:
-            from cocotb.triggers import ClockCycles
-            self._clock_cycles = ClockCycles
-        return self._clock_cycles
+    def _next_jitter(self) -> int:
+        """Next jitter delay in cycles from the current jitter_range."""
+        return self._jitter.draw(*self.jitter_range)
 
     async def set_control_register(self, reg_num: int, value: int):
         """Set control register with optional jitter delay."""
-        ClockCycles = self._get_clock_cycles()
+        if self._queue_write(reg_num, value):
+            return
 
         if self.jitter_enabled:
-            delay = random.randint(*self.jitter_range)
-            await ClockCycles(self.dut.Clk, delay)
+            await ClockCycles(self.dut.Clk, self._next_jitter())
 
-        ctrl_signal = getattr(self.dut, f"Control{reg_num}", None)
-        if ctrl_signal is not None:
-            ctrl_signal.value = value
-        else:
-            raise ValueError(f"Control register {reg_num} not found on DUT")
+        self._ctrl_signal(reg_num).value = value
+
+    async def set_control_registers(self, values: Dict[int, int]):
+        """Set several control registers after a single jitter delay.
+
+        Signal writes are deferred by the simulator, so all of them land
+        on the same delta cycle.
+        """
+        if not values or self._queue_writes(values):
+            return
+
+        if self.jitter_enabled:
+            await ClockCycles(self.dut.Clk, self._next_jitter())
+
+        for reg_num, value in values.items():
+            self._ctrl_signal(reg_num).value = value
 
     async def get_control_register(self, reg_num: int) -> int:
         """Get control register value."""
-        ctrl_signal = getattr(self.dut, f"Control{reg_num}", None)
-        if ctrl_signal is not None:
-            return int(ctrl_signal.value)
-        raise ValueError(f"Control register {reg_num} not found on DUT")
+        return self._ctrl_signal(reg_num).value.to_unsigned()
 
     async def wait_cycles(self, cycles: int):
         """Wait for clock cycles."""
-        ClockCycles = self._get_clock_cycles()
         if cycles > 0:
             await ClockCycles(self.dut.Clk, cycles)
 
@@ -83,6 +112,8 @@ class CocoTBAsyncController(AsyncFSMController):
 class CocoTBAsyncStateReader(AsyncFSMStateReader):
     """CocoTB state reader - instant signal access."""
 
+    __slots__ = ("dut",)
+
     def __init__(self, dut):
         self.dut = dut
 
@@ -94,17 +125,22 @@ class CocoTBAsyncStateReader(AsyncFSMStateReader):
 class CocoTBAsyncHarness(AsyncFSMTestHarness):
     """CocoTB test harness with jitter support."""
 
+    __slots__ = ("dut", "_controller", "_state_reader")
+
     def __init__(self, dut, jitter_enabled: bool = False,
-                 jitter_range: Tuple[int, int] = (10, 200)):
+                 jitter_range: Tuple[int, int] = (10, 200),
+                 seed: Optional[int] = None):
         """Initialize CocoTB harness.
 
         Args:
             dut: CocoTB DUT object
             jitter_enabled: Simulate network-like write delays
             jitter_range: (min_cycles, max_cycles) for jitter
+            seed: Seed for the jitter RNG (None = module-level random,
+                  seeded by cocotb from RANDOM_SEED)
         """
         self.dut = dut
-        self._controller = CocoTBAsyncController(dut, jitter_enabled, jitter_range)
+        self._controller = CocoTBAsyncController(dut, jitter_enabled, jitter_range, seed)
         self._state_reader = CocoTBAsyncStateReader(dut)
 
     @property
@@ -117,26 +153,57 @@ class CocoTBAsyncHarness(AsyncFSMTestHarness):
 
     async def wait_for_state(self, target_state: str, timeout_us: int = 1000,
                               tolerance: int = SIM_HVS_TOLERANCE) -> bool:
-        """Wait for FSM state with cycle-accurate polling."""
-        from cocotb.triggers import ClockCycles
+        """Wait for FSM state, waking only when OutputC changes.
+
+        The whole wait runs under one with_timeout() deadline, so the
+        timeout bounds the total time however often OutputC toggles, and
+        the wait costs one wakeup per OutputC change instead of one per
+        clock.
 
+        Args:
+            target_state: State name to wait for
+            timeout_us: Timeout in microseconds
+            tolerance: Allowed digital deviation from the state level
+        """
         target_digital = state_to_digital(target_state)
         if target_digital is None:
             raise ValueError(f"Unknown state: {target_state}")
 
-        timeout_cycles = int(timeout_us * CLK_FREQ_HZ / 1e6)
+        # Integer window, compared directly on every read
+        low, high = target_digital - tolerance, target_digital + tolerance
+
+        try:
+            await with_timeout(self._wait_in_window(low, high), timeout_us, "us")
+        except SimTimeoutError:
+            return False
+        return True
+
+    async def _wait_in_window(self, low: int, high: int):
+        """Return once OutputC is within [low, high], checking on each change."""
+        output_c = self.dut.OutputC
+        while not low <= await self._state_reader.read_state_digital() <= high:
+            await output_c.value_change
 
-        for _ in range(timeout_cycles):
-            actual = await self._state_reader.read_state_digital()
-            if abs(actual - target_digital) <= tolerance:
-                return True
-            await ClockCycles(self.dut.Clk, 1)
+    async def pulse_sw_trigger(self, width: int = 10):
+        """Issue software trigger and release CR0[0] in the background.
+
+        The release is forked with cocotb.start_soon(), so the test keeps
+        running while the trigger bit is still held. It clears only CR0[0]
+        of the value CR0 holds at that point, so a disarm(), clear_fault()
+        or disable_forge() written inside the window is kept.
+        """
+        await self.controller.trigger()
+        start_soon(self._release_trigger_after(width))
 
-        return False
+    async def _release_trigger_after(self, width: int):
+        await ClockCycles(self.dut.Clk, width)
+        cr0 = self._controller._ctrl_signal(0)
+        current = cr0.value.to_unsigned()
+        if current & CR0.SW_TRIGGER_MASK:
+            cr0.value = current & ~CR0.SW_TRIGGER_MASK
 
     async def apply_reset(self, cycles: int = 10):
         """Apply reset pulse."""
-        from cocotb.triggers import ClockCycles
         self.dut.Reset.value = 1
         await ClockCycles(self.dut.Clk, cycles)
         self.dut.Reset.value = 0
@@ -6,26 +6,34 @@ Provides Moku implementation of the unified async interface.
 Wraps synchronous Moku API with async operations.
 """
 
+import array
 import asyncio
-import time
-from typing import Tuple
+from typing import Dict, Optional, Tuple
+
+import numpy as np
 
 from .base import (
     AsyncFSMController,
     AsyncFSMStateReader,
     AsyncFSMTestHarness,
+    decode_state_from_digital,
     state_to_voltage,
     CLK_FREQ_HZ,
 )
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from lib import HW_HVS_TOLERANCE_V, HVS
 
 
 class MokuAsyncController(AsyncFSMController):
-    """Async wrapper around synchronous Moku CloudCompile API."""
+    """Async wrapper around synchronous Moku CloudCompile API.
+
+    Writes do not sleep for propagation_delay_ms themselves. Each write
+    sets a settle deadline instead. The next write, and every state read
+    through MokuAsyncStateReader, waits only for whatever is left of it.
+    Time the caller spends elsewhere counts toward the delay.
+    """
+
+    __slots__ = ("mcc", "propagation_delay_ms", "_shadow", "_settle_at")
 
     def __init__(self, mcc, propagation_delay_ms: float = 10.0):
         """Initialize with Moku CloudCompile instance.
@@ -37,20 +45,60 @@ class MokuAsyncController(AsyncFSMController):
         super().__init__()  # Initialize _forge_state and _lifecycle_state
         self.mcc = mcc
         self.propagation_delay_ms = propagation_delay_ms
-        self._shadow_regs = {}
+        # Last value written to each of CR0-CR15 (all start zeroed on reset)
+        self._shadow = array.array('I', [0] * 16)
+        # Event-loop time at which the last write has propagated
+        self._settle_at = 0.0
+
+    async def settle(self):
+        """Wait until the last write has had propagation_delay_ms to land."""
+        remaining = self._settle_at - asyncio.get_running_loop().time()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    def _mark_written(self):
+        self._settle_at = (asyncio.get_running_loop().time()
+                           + self.propagation_delay_ms / 1000.0)
 
     async def set_control_register(self, reg_num: int, value: int):
         """Set control register via Moku API."""
+        if self._queue_write(reg_num, value):
+            return
+        await self.settle()
         self.mcc.set_control(reg_num, value)
-        self._shadow_regs[reg_num] = value
-        await asyncio.sleep(self.propagation_delay_ms / 1000.0)
+        self._shadow[reg_num] = value & 0xFFFFFFFF
+        self._mark_written()
+
+    async def set_control_registers(self, values: Dict[int, int]):
+        """Set several control registers in one set_controls() call.
+
+        One network round-trip and one propagation delay for the whole
+        batch, instead of one of each per register. Without set_controls()
+        the writes go out one by one, still with a single settle deadline.
+        """
+        if not values or self._queue_writes(values):
+            return
+        await self.settle()
+        if hasattr(self.mcc, "set_controls"):
+            self.mcc.set_controls([{"idx": n, "value": v} for n, v in values.items()])
+        else:
+            for reg_num, value in values.items():
+                self.mcc.set_control(reg_num, value)
+        for reg_num, value in values.items():
+            self._shadow[reg_num] = value & 0xFFFFFFFF
+        self._mark_written()
 
     async def get_control_register(self, reg_num: int) -> int:
         """Get control register value from shadow registers."""
-        return self._shadow_regs.get(reg_num, 0)
+        return self._shadow[reg_num]
 
     async def wait_cycles(self, cycles: int):
-        """Wait for equivalent time of N clock cycles."""
+        """Wait for equivalent time of N clock cycles.
+
+        Non-zero waits sleep at least 1 ms; wait_cycles(0) returns at once.
+        """
+        if cycles <= 0:
+            return
         time_sec = cycles / CLK_FREQ_HZ
         await asyncio.sleep(max(time_sec, 0.001))
 
@@ -58,17 +106,31 @@ class MokuAsyncController(AsyncFSMController):
 class MokuAsyncStateReader(AsyncFSMStateReader):
     """Async state reader using oscilloscope polling."""
 
-    def __init__(self, osc, poll_count: int = 5, poll_interval_ms: float = 20):
+    __slots__ = ("osc", "poll_count", "poll_interval_ms", "_frame_len", "_window",
+                 "_controller")
+
+    # Samples taken either side of the frame midpoint in each capture
+    WINDOW_HALF_WIDTH = 16
+
+    def __init__(self, osc, poll_count: int = 2, poll_interval_ms: float = 20,
+                 controller: Optional[MokuAsyncController] = None):
         """Initialize with oscilloscope instance.
 
         Args:
             osc: Moku Oscilloscope instrument
-            poll_count: Number of samples to average
-            poll_interval_ms: Interval between samples
+            poll_count: Number of captures to average
+            poll_interval_ms: Interval between captures
+            controller: Controller whose last write must settle before
+                        each capture
         """
         self.osc = osc
+        self._controller = controller
         self.poll_count = poll_count
         self.poll_interval_ms = poll_interval_ms
+        # Frame length is fixed by the timebase, so the midpoint window is
+        # cached across polls and only recomputed if the length changes
+        self._frame_len = 0
+        self._window = slice(0, 0)
 
     async def read_state_digital(self) -> int:
         """Read OutputC as digital value via oscilloscope."""
@@ -79,29 +141,63 @@ class MokuAsyncStateReader(AsyncFSMStateReader):
         """Read OutputC voltage directly."""
         return await self._read_voltage_averaged()
 
+    async def get_state_and_voltage(self) -> Tuple[str, int, float]:
+        """Get state, digital value and voltage from one averaged capture."""
+        voltage = await self._read_voltage_averaged()
+        digital = HVS.volts_to_digital(voltage)
+        return decode_state_from_digital(digital), digital, voltage
+
+    async def read_state_voltage_fast(self) -> float:
+        """Read OutputC voltage from a single capture, without averaging."""
+        if self._controller is not None:
+            await self._controller.settle()
+        ch1 = self.osc.get_data().get('ch1')
+        if ch1 is None or len(ch1) == 0:
+            raise RuntimeError("Failed to read oscilloscope data")
+        if len(ch1) != self._frame_len:
+            self._frame_len = len(ch1)
+            midpoint = self._frame_len // 2
+            self._window = slice(max(0, midpoint - self.WINDOW_HALF_WIDTH),
+                                 midpoint + self.WINDOW_HALF_WIDTH)
+        # Slice before converting: a list frame then only copies the window
+        return float(np.median(np.asarray(ch1[self._window], dtype=np.float64)))
+
     async def _read_voltage_averaged(self) -> float:
-        """Read oscilloscope with averaging."""
-        voltages = []
+        """Read oscilloscope with averaging.
+
+        Each capture contributes the median of a window of samples around
+        the frame midpoint, so fewer captures give a stable reading and
+        single-sample glitches are rejected.
+        """
+        voltages = np.empty(self.poll_count, dtype=np.float64)
+        count = 0
 
         for _ in range(self.poll_count):
             try:
-                data = self.osc.get_data()
-                if 'ch1' in data and len(data['ch1']) > 0:
-                    midpoint = len(data['ch1']) // 2
-                    voltages.append(data['ch1'][midpoint])
+                voltages[count] = await self.read_state_voltage_fast()
+                count += 1
             except Exception:
                 pass
             await asyncio.sleep(self.poll_interval_ms / 1000.0)
 
-        if not voltages:
+        if count == 0:
             raise RuntimeError("Failed to read oscilloscope data")
 
-        return sum(voltages) / len(voltages)
+        return float(voltages[:count].mean())
 
 
 class MokuAsyncHarness(AsyncFSMTestHarness):
     """Async Moku hardware test harness."""
 
+    __slots__ = ("mcc", "osc", "_controller", "_state_reader", "_initialized")
+
+    # wait_for_state poll schedule: fine gap held for the fine window (where
+    # most transitions land), then backoff by POLL_BACKOFF up to the cap
+    POLL_MIN_S = 0.01
+    POLL_FINE_WINDOW_S = 0.2
+    POLL_BACKOFF = 1.5
+    POLL_MAX_S = 0.1
+
     def __init__(self, mcc, osc, propagation_delay_ms: float = 10.0):
         """Initialize hardware harness.
 
@@ -113,7 +209,7 @@ class MokuAsyncHarness(AsyncFSMTestHarness):
         self.mcc = mcc
         self.osc = osc
         self._controller = MokuAsyncController(mcc, propagation_delay_ms)
-        self._state_reader = MokuAsyncStateReader(osc)
+        self._state_reader = MokuAsyncStateReader(osc, controller=self._controller)
         self._initialized = False
 
     async def initialize_fsm(self):
@@ -129,20 +225,19 @@ class MokuAsyncHarness(AsyncFSMTestHarness):
         if self._initialized:
             return
 
-        # Clear all registers first
-        for i in range(11):
-            self.mcc.set_control(i, 0)
+        # Clear all registers first (one batched write)
+        await self._controller.set_control_registers({i: 0 for i in range(11)})
         await asyncio.sleep(0.1)
 
-        # Set valid timing config BEFORE FORGE enable
-        self.mcc.set_control(4, 12500)      # trig_duration: 100μs @ 125MHz
-        self.mcc.set_control(5, 25000)      # intensity_duration: 200μs
-        self.mcc.set_control(6, 250000000)  # timeout: 2s
-        self.mcc.set_control(7, 1250)       # cooldown: 10μs
-
-        # Set output voltages
-        self.mcc.set_control(2, (1000 << 16) | 2000)  # threshold=1V, trig_out=2V
-        self.mcc.set_control(3, 1500)                  # intensity=1.5V
+        # Set valid timing config and output voltages BEFORE FORGE enable
+        await self._controller.set_control_registers({
+            4: 12500,                # trig_duration: 100μs @ 125MHz
+            5: 25000,                # intensity_duration: 200μs
+            6: 250000000,            # timeout: 2s
+            7: 1250,                 # cooldown: 10μs
+            2: (1000 << 16) | 2000,  # threshold=1V, trig_out=2V
+            3: 1500,                 # intensity=1.5V
+        })
         await asyncio.sleep(0.1)
 
         # Enable FORGE + pulse fault_clear (CR0[1]) to re-latch config
@@ -164,19 +259,44 @@ class MokuAsyncHarness(AsyncFSMTestHarness):
 
     async def wait_for_state(self, target_state: str, timeout_us: int = 1000,
                               tolerance: float = HW_HVS_TOLERANCE_V) -> bool:
-        """Wait for FSM state with polling."""
+        """Wait for FSM state with backoff polling.
+
+        Polls with single-capture reads, and confirms a match with one
+        averaged read before returning. Reads are POLL_MIN_S apart for the
+        first POLL_FINE_WINDOW_S, then the gap grows by POLL_BACKOFF up to
+        POLL_MAX_S. The wait is
+        bounded by asyncio.wait_for(), so it ends at the deadline even
+        mid-sleep.
+        """
         target_voltage = state_to_voltage(target_state)
         if target_voltage is None:
             raise ValueError(f"Unknown state: {target_state}")
 
-        timeout_ms = max(timeout_us / 1000.0, 100)
-        start_time = time.time()
-        poll_interval_s = 0.05
-
-        while (time.time() - start_time) * 1000 < timeout_ms:
-            voltage = await self._state_reader.read_state_voltage()
-            if abs(voltage - target_voltage) < tolerance:
-                return True
+        timeout_s = max(timeout_us / 1e6, 0.1)
+        try:
+            return await asyncio.wait_for(
+                self._poll_until_match(target_voltage - tolerance,
+                                       target_voltage + tolerance),
+                timeout_s,
+            )
+        except TimeoutError:
+            return False
+
+    async def _poll_until_match(self, low: float, high: float) -> bool:
+        """Poll OutputC until it reads inside (low, high), confirmed by an averaged read."""
+        loop = asyncio.get_running_loop()
+        coarse_after = loop.time() + self.POLL_FINE_WINDOW_S
+        poll_interval_s = self.POLL_MIN_S
+
+        while True:
+            try:
+                voltage = await self._state_reader.read_state_voltage_fast()
+            except Exception:
+                voltage = None  # Dropped capture; treat as no match
+            if voltage is not None and low < voltage < high:
+                voltage = await self._state_reader.read_state_voltage()
+                if low < voltage < high:
+                    return True
             await asyncio.sleep(poll_interval_s)
-
-        return False
+            if loop.time() >= coarse_after:
+                poll_interval_s = min(poll_interval_s * self.POLL_BACKOFF, self.POLL_MAX_S)
@@ -0,0 +1,98 @@
+"""
+Deployment Cache - Skip Redundant Bitstream Uploads
+====================================================
+
+CloudCompile bitstream upload dominates hardware session setup. This module
+records which bitstream was last deployed to which device so that
+MokuSession can reattach to the running instrument instead of re-uploading.
+
+A cache entry is keyed by device IP and holds a fingerprint of the bitstream
+(resolved path + size + mtime) and the slot it was deployed to. The cache is
+only a hint: MokuSession still confirms that the slot holds a CloudCompile
+instrument before trusting it, and --force always invalidates it.
+
+Cache file: ~/.cache/dpd/deployed.json
+
+Author: Moku Instrument Forge Team
+Date: 2025-11-28
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+CACHE_PATH = Path.home() / ".cache" / "dpd" / "deployed.json"
+
+
+def bitstream_fingerprint(device_ip: str, bitstream_path: str) -> str:
+    """
+    Fingerprint a bitstream deployment.
+
+    Args:
+        device_ip: Moku device IP address
+        bitstream_path: Path to CloudCompile bitstream
+
+    Returns:
+        sha256 hex digest of device IP, resolved path, size and mtime
+    """
+    path = Path(bitstream_path).resolve()
+    stat = path.stat()
+    key = f"{device_ip}|{path}|{stat.st_size}|{stat.st_mtime_ns}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _load() -> dict:
+    try:
+        with open(CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _store(entries: dict):
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2)
+    except OSError:
+        # The cache is an optimization only; never fail a session over it
+        pass
+
+
+def is_deployed(device_ip: str, bitstream_path: str, cc_slot: int) -> bool:
+    """
+    Check whether this bitstream was the last one deployed to the device.
+
+    Args:
+        device_ip: Moku device IP address
+        bitstream_path: Path to CloudCompile bitstream
+        cc_slot: Slot the bitstream is expected in
+
+    Returns:
+        True if the cached fingerprint and slot match
+    """
+    entry = _load().get(device_ip)
+    if not entry:
+        return False
+    try:
+        fingerprint = bitstream_fingerprint(device_ip, bitstream_path)
+    except OSError:
+        return False
+    return entry.get("fingerprint") == fingerprint and entry.get("cc_slot") == cc_slot
+
+
+def record_deployment(device_ip: str, bitstream_path: str, cc_slot: int):
+    """Record a successful bitstream deployment."""
+    entries = _load()
+    entries[device_ip] = {
+        "fingerprint": bitstream_fingerprint(device_ip, bitstream_path),
+        "cc_slot": cc_slot,
+    }
+    _store(entries)
+
+
+def invalidate(device_ip: str):
+    """Forget any cached deployment for a device."""
+    entries = _load()
+    if entries.pop(device_ip, None) is not None:
+        _store(entries)
@@ -5,9 +5,10 @@ Hardware Plumbing - Moku Device Setup and Teardown
 Extracted from run_hw_tests.py to enable unified sim/hw testing.
 This module handles all hardware-specific concerns:
 - Device connection
-- Instrument deployment (Oscilloscope + CloudCompile)
+- Instrument deployment (Oscilloscope + CloudCompile), optionally skipping
+  the bitstream upload when hw/deploy_cache.py says it is already deployed
 - Routing configuration
-- Cleanup/disconnect
+- Cleanup/disconnect (connections are pooled per process and released at exit)
 
 Usage:
     from hw.plumbing import MokuSession
@@ -18,6 +19,7 @@ Usage:
 """
 
 import sys
+import atexit
 import asyncio
 from pathlib import Path
 from dataclasses import dataclass
@@ -27,8 +29,9 @@ from typing import Optional
 HW_PATH = Path(__file__).parent
 TESTS_PATH = HW_PATH.parent
 PROJECT_ROOT = TESTS_PATH.parent
-sys.path.insert(0, str(TESTS_PATH))
-sys.path.insert(0, str(PROJECT_ROOT / "py_tools"))
+for _path in (TESTS_PATH, PROJECT_ROOT / "py_tools"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
 
 # Import loguru for consistent logging
 try:
@@ -39,6 +42,26 @@ except ImportError:
     logger = logging.getLogger(__name__)
 
 from adapters import MokuAsyncHarness
+from hw import deploy_cache
+
+
+# Open device connections, shared by every MokuSession in this process and
+# keyed on (device_ip, platform_id). Re-entering a session against the same
+# device reuses the handle instead of a fresh connect + ownership handshake.
+_connections: dict = {}
+
+
+def release_connections():
+    """Relinquish ownership of all pooled device connections."""
+    while _connections:
+        _, moku = _connections.popitem()
+        try:
+            moku.relinquish_ownership()
+        except Exception as e:
+            logger.debug(f"Disconnect warning: {e}")
+
+
+atexit.register(release_connections)
 
 
 @dataclass
@@ -50,7 +73,14 @@ class MokuConfig:
     cc_slot: int = 2
     platform_id: int = 2  # Moku:Go
     force_connect: bool = False
+    # Reattach to an already-deployed bitstream instead of re-uploading.
+    # Opt-in: the device is only asked whether the slot holds *a*
+    # CloudCompile, not which bitstream it runs.
+    warm_start: bool = False
     propagation_delay_ms: float = 10.0
+    # Points per oscilloscope frame. State reads only sample the frame
+    # midpoint, so a shorter frame means fewer bytes per poll.
+    osc_max_length: int = 1024
 
 
 class MokuSession:
@@ -63,6 +93,12 @@ class MokuSession:
     - Signal routing (OutputC → OscInA for HVS state observation)
     - Graceful cleanup on exit
 
+    Leaving the session does not release the device: the connection stays
+    in the process pool and ownership is relinquished only at interpreter
+    exit (release_connections() via atexit). A process that crashes or is
+    killed never runs atexit, so the device stays claimed until the next
+    connection uses force_connect (--force).
+
     Example:
         config = MokuConfig(device_ip="192.168.31.41", bitstream_path="dpd.tar")
         async with MokuSession(config) as session:
@@ -90,23 +126,49 @@ class MokuSession:
         return False
 
     async def _connect(self):
-        """Connect to Moku device."""
-        # Import here to avoid dependency issues when running sim-only
-        try:
-            from moku.instruments import MultiInstrument
-        except ImportError:
-            raise RuntimeError("moku package not installed. Run: uv sync")
+        """Connect to Moku device, reusing a pooled connection if present.
+
+        force_connect always opens a fresh connection, relinquishing any
+        pooled handle for the same device first.
+        """
+        key = (self.config.device_ip, self.config.platform_id)
+        if key in _connections:
+            if not self.config.force_connect:
+                logger.debug(f"Reusing connection to {self.config.device_ip}")
+                self.moku = _connections[key]
+                self._connected = True
+                return
+            stale = _connections.pop(key)
+            try:
+                stale.relinquish_ownership()
+            except Exception as e:
+                logger.debug(f"Disconnect warning: {e}")
 
+        # Import here to avoid dependency issues when running sim-only.
+        # MultiInstrument is only referenced by the fallback path, so it is
+        # not imported at all when moku_cli_common is available.
         try:
             from moku_cli_common import connect_to_device
-            self.moku = connect_to_device(
-                self.config.device_ip,
-                self.config.platform_id,
-                force=self.config.force_connect,
-                read_timeout=5
-            )
         except ImportError:
+            connect_to_device = None
+
+        if connect_to_device is not None:
+            try:
+                self.moku = connect_to_device(
+                    self.config.device_ip,
+                    self.config.platform_id,
+                    force=self.config.force_connect,
+                    read_timeout=5
+                )
+            except ImportError:
+                raise RuntimeError("moku package not installed. Run: uv sync")
+        else:
             # Fallback if moku_cli_common not available
+            try:
+                from moku.instruments import MultiInstrument
+            except ImportError:
+                raise RuntimeError("moku package not installed. Run: uv sync")
+
             logger.debug("moku_cli_common not available, using direct MultiInstrument")
             self.moku = MultiInstrument(
                 self.config.device_ip,
@@ -114,6 +176,7 @@ class MokuSession:
                 force_connect=self.config.force_connect
             )
 
+        _connections[key] = self.moku
         self._connected = True
 
     async def _deploy_instruments(self):
@@ -133,22 +196,71 @@ class MokuSession:
         #   Slot{cc}OutC → Slot{osc}InA (internal, no analog frontend)
         # The oscilloscope receives the full ±5V digital range from CloudCompile OutputC.
         try:
-            self.osc.set_timebase(-0.001, 0.001)  # 2ms window centered at trigger
-            logger.debug("Oscilloscope configured: 2ms timebase window")
+            # 2ms window centered at trigger
+            self.osc.set_timebase(-0.001, 0.001, max_length=self.config.osc_max_length)
+            logger.debug(f"Oscilloscope configured: 2ms timebase window, {self.config.osc_max_length} points")
         except Exception as e:
             logger.warning(f"Could not configure oscilloscope timebase: {e}")
 
-        logger.debug(f"Deploying CloudCompile to slot {self.config.cc_slot} with bitstream {self.config.bitstream_path}")
-        self.mcc = self.moku.set_instrument(
-            self.config.cc_slot,
-            CloudCompile,
-            bitstream=self.config.bitstream_path
-        )
+        self.mcc = None
+        if self._bitstream_deployed():
+            # Warm start: reattach to the running instrument, skip the upload.
+            # for_slot() binds to the slot without deploying (as in
+            # py_tools/moku_grab.py); CloudCompile still needs the bitstream path
+            logger.debug(f"Bitstream already deployed to slot {self.config.cc_slot}, reattaching")
+            try:
+                self.mcc = CloudCompile.for_slot(
+                    slot=self.config.cc_slot,
+                    multi_instrument=self.moku,
+                    bitstream=self.config.bitstream_path
+                )
+            except Exception as e:
+                logger.warning(f"Could not reattach to slot {self.config.cc_slot}, redeploying: {e}")
+
+        if self.mcc is None:
+            deploy_cache.invalidate(self.config.device_ip)
+            logger.debug(f"Deploying CloudCompile to slot {self.config.cc_slot} with bitstream {self.config.bitstream_path}")
+            self.mcc = self.moku.set_instrument(
+                self.config.cc_slot,
+                CloudCompile,
+                bitstream=self.config.bitstream_path
+            )
+            deploy_cache.record_deployment(
+                self.config.device_ip,
+                self.config.bitstream_path,
+                self.config.cc_slot
+            )
 
         # Brief delay for instruments to initialize
         await asyncio.sleep(0.5)
         logger.debug("Instruments deployed successfully")
 
+    def _bitstream_deployed(self) -> bool:
+        """Check the deploy cache and confirm the device still agrees.
+
+        Only used with warm_start. The bitstream has no ID register to read
+        back, so a different CloudCompile bitstream loaded into the slot
+        since our last upload (e.g. from another host) goes undetected.
+        """
+        if self.config.force_connect or not self.config.warm_start:
+            return False
+        if not deploy_cache.is_deployed(
+            self.config.device_ip,
+            self.config.bitstream_path,
+            self.config.cc_slot
+        ):
+            return False
+
+        # The cache only knows what we last uploaded; make sure nobody has
+        # swapped the slot out since.
+        try:
+            instruments = self.moku.get_instruments()
+        except Exception as e:
+            logger.debug(f"Could not query slot contents: {e}")
+            return False
+        index = self.config.cc_slot - 1
+        return index < len(instruments) and instruments[index] == "CloudCompile"
+
     async def _setup_routing(self):
         """Configure signal routing for HVS observation."""
         osc_slot = self.config.osc_slot
@@ -179,14 +291,13 @@ class MokuSession:
             logger.debug("Routing already configured")
 
     async def _disconnect(self):
-        """Disconnect from device."""
+        """Detach from device.
+
+        The connection stays in the process pool for the next session;
+        ownership is relinquished at exit by release_connections().
+        """
         if self.moku and self._connected:
-            try:
-                logger.debug("Disconnecting from device...")
-                self.moku.relinquish_ownership()
-                logger.debug("Disconnected")
-            except Exception as e:
-                logger.debug(f"Disconnect warning: {e}")
+            logger.debug("Session closed (connection kept for reuse)")
             self._connected = False
 
     def create_harness(self) -> MokuAsyncHarness:
@@ -0,0 +1,62 @@
+"""
+Hardware Test Registry - Resolve Test Entry Points Once
+=======================================================
+
+Maps test-module names (as passed to run.py --test-module) to their
+hardware entry point: an async callable taking a harness and returning
+True if all tests passed.
+
+Test modules can register explicitly:
+
+    from hw.registry import register
+
+    @register("dpd.P1_basic")
+    async def run_hardware_tests(harness) -> bool:
+        ...
+
+Modules that just define a module-level run_hardware_tests() are picked up
+on first lookup. Either way the module is imported and resolved at most
+once per process.
+
+Author: Moku Instrument Forge Team
+Date: 2025-11-28
+"""
+
+import importlib
+from typing import Awaitable, Callable, Dict, Optional
+
+HardwareRunner = Callable[..., Awaitable[bool]]
+
+TEST_REGISTRY: Dict[str, Optional[HardwareRunner]] = {}
+
+
+def register(name: str):
+    """Decorator: register a hardware entry point under a test-module name."""
+    def decorator(func: HardwareRunner) -> HardwareRunner:
+        TEST_REGISTRY[name] = func
+        return func
+    return decorator
+
+
+def resolve(name: str) -> Optional[HardwareRunner]:
+    """
+    Look up the hardware entry point for a test module.
+
+    Args:
+        name: Test module name, dotted or slash-separated (e.g. dpd.P1_basic)
+
+    Returns:
+        The registered callable, or None if the module has no hardware
+        entry point
+
+    Raises:
+        ImportError: If the module cannot be imported
+    """
+    if name in TEST_REGISTRY:
+        return TEST_REGISTRY[name]
+
+    module = importlib.import_module(name.replace("/", "."))
+    # Importing may have run an @register decorator for this name
+    runner = TEST_REGISTRY.get(name) or getattr(module, "run_hardware_tests", None)
+    TEST_REGISTRY[name] = runner
+    return runner
@@ -17,32 +17,24 @@ API v4.0 Changes:
 Reference: docs/api-v4.md
 """
 
-# Hardware constants (from py_tools/dpd_constants.py)
+import importlib
+from types import MappingProxyType
+
+# Hardware constants (from py_tools/dpd_constants.py). CR1, FSMState,
+# DefaultTiming, cr0_extract and cr8_build are resolved lazily (see _LAZY).
 from .hw import (
     CR0,
-    CR1,
     CR8,
-    FSMState,
     HVS,
     Platform,
-    DefaultTiming,
     cr0_build,
-    cr0_extract,
-    cr8_build,
-    # Convenience aliases
-    MCC_CR0_ALL_ENABLED,
-    MCC_CR0_FORGE_READY,
-    MCC_CR0_USER_ENABLE,
-    MCC_CR0_CLK_ENABLE,
-    HVS_DIGITAL_INITIALIZING,
-    HVS_DIGITAL_IDLE,
-    HVS_DIGITAL_ARMED,
-    HVS_DIGITAL_FIRING,
-    HVS_DIGITAL_COOLDOWN,
-    mv_to_digital,
-    digital_to_mv,
 )
 
+# Convenience aliases (MCC_CR0_*, HVS_DIGITAL_*, mv_to_digital, digital_to_mv,
+# digital_to_mv_int) are resolved lazily by hw.__getattr__; see __getattr__ at
+# the end of this file.
+from . import hw as _hw
+
 # Clock utilities (from py_tools/clk_utils.py)
 from .clk import (
     s_to_cycles,
@@ -71,30 +63,53 @@ from .tolerances import (
 # Timeouts
 from .timeouts import Timeouts
 
-# Configuration dataclass
-from .dpd_config import DPDConfig
-
-# Test base classes
-from .test_base import (
-    TestLevel,
-    VerbosityLevel,
-    TestResult,
-    TestRunnerMixin,
-)
-
-# [COMPAT] Backward compatibility aliases - delete once imports updated
-P1TestValues = P1Timing
-P2TestValues = P2Timing
-HVS_DIGITAL_TOLERANCE = SIM_HVS_TOLERANCE
-CLK_PERIOD_NS = Platform.CLK_PERIOD_NS
-CLK_FREQ_HZ = Platform.CLK_FREQ_HZ
-
-# Trigger values (from timing base)
-TRIGGER_THRESHOLD_MV = P1Timing.TRIGGER_THRESHOLD_MV
-TRIGGER_TEST_VOLTAGE_MV = P1Timing.TRIGGER_TEST_VOLTAGE_MV
-TRIGGER_THRESHOLD_DIGITAL = P1Timing.TRIGGER_THRESHOLD_DIGITAL
-TRIGGER_TEST_VOLTAGE_DIGITAL = P1Timing.TRIGGER_TEST_VOLTAGE_DIGITAL
+# Names imported on first access (PEP 562), so modules that only need the
+# common constants (e.g. the adapters) skip the configuration dataclass, the
+# test base classes and rarely used re-exports:
+# name -> (submodule, dotted attribute path)
+_LAZY = {
+    # Hardware constants with few users
+    'CR1': ('hw', 'CR1'),
+    'FSMState': ('hw', 'FSMState'),
+    'DefaultTiming': ('hw', 'DefaultTiming'),
+    'cr0_extract': ('hw', 'cr0_extract'),
+    'cr8_build': ('hw', 'cr8_build'),
+    # Configuration dataclass and test base classes
+    'DPDConfig': ('dpd_config', 'DPDConfig'),
+    'TestLevel': ('test_base', 'TestLevel'),
+    'VerbosityLevel': ('test_base', 'VerbosityLevel'),
+    'TestResult': ('test_base', 'TestResult'),
+    'TestRunnerMixin': ('test_base', 'TestRunnerMixin'),
+    'load_passed_tests': ('test_base', 'load_passed_tests'),
+    # Simulated write jitter
+    'JitterPool': ('jitter', 'JitterPool'),
+    # [COMPAT] Backward compatibility aliases - delete once imports updated
+    'P1TestValues': ('timing', 'P1Timing'),
+    'P2TestValues': ('timing', 'P2Timing'),
+    'HVS_DIGITAL_TOLERANCE': ('tolerances', 'SIM_HVS_TOLERANCE'),
+    'CLK_PERIOD_NS': ('hw', 'Platform.CLK_PERIOD_NS'),
+    'CLK_FREQ_HZ': ('hw', 'Platform.CLK_FREQ_HZ'),
+    # Trigger values (from timing base)
+    'TRIGGER_THRESHOLD_MV': ('timing', 'P1Timing.TRIGGER_THRESHOLD_MV'),
+    'TRIGGER_TEST_VOLTAGE_MV': ('timing', 'P1Timing.TRIGGER_TEST_VOLTAGE_MV'),
+    'TRIGGER_THRESHOLD_DIGITAL': ('timing', 'P1Timing.TRIGGER_THRESHOLD_DIGITAL'),
+    'TRIGGER_TEST_VOLTAGE_DIGITAL': ('timing', 'P1Timing.TRIGGER_TEST_VOLTAGE_DIGITAL'),
+}
 
 # State voltage map (for hardware tests)
 STATE_VOLTAGE_MAP = HVS.STATE_VOLTAGE_MAP
-VOLTAGE_STATE_MAP = {v: k for k, v in STATE_VOLTAGE_MAP.items()}
+VOLTAGE_STATE_MAP = MappingProxyType({v: k for k, v in STATE_VOLTAGE_MAP.items()})
+
+
+def __getattr__(name):
+    if name in _hw._ALIASES:
+        value = getattr(_hw, name)
+    elif name in _LAZY:
+        submodule, path = _LAZY[name]
+        value = importlib.import_module(f".{submodule}", __name__)
+        for attr in path.split("."):
+            value = getattr(value, attr)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
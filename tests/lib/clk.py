@@ -8,9 +8,11 @@ The authoritative source is py_tools/clk_utils.py.
 import sys
 from pathlib import Path
 
-# Add py_tools to path
+# Add py_tools to path (once, not on every import)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "py_tools"))
+_PY_TOOLS = str(PROJECT_ROOT / "py_tools")
+if _PY_TOOLS not in sys.path:
+    sys.path.insert(0, _PY_TOOLS)
 
 # Re-export everything from clk_utils
 from clk_utils import (
@@ -16,14 +16,19 @@ CR1 is reserved for future campaign mode.
 Reference: docs/api-v4.md
 """
 
-from dataclasses import dataclass
-from typing import List, Dict
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple
 
 from .hw import CR8
 from .clk import cycles_to_s, cycles_to_us
 
+# CR8 bit positions, resolved once at import (used on every _build_cr8 call)
+_CR8_AUTO_REARM_SHIFT = CR8.AUTO_REARM_ENABLE
+_CR8_EXPECT_NEGATIVE_SHIFT = CR8.MONITOR_EXPECT_NEGATIVE
+_CR8_MONITOR_ENABLE_SHIFT = CR8.MONITOR_ENABLE
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class DPDConfig:
     """
     Configuration for DPD control registers CR2-CR10.
@@ -50,6 +55,9 @@ class DPDConfig:
 
     NOTE: CR0 (FORGE + lifecycle) and CR1 (reserved) are handled
     separately via adapter methods, not this config class.
+
+    Instances are immutable (frozen, slotted); derive variants with
+    dataclasses.replace(config, field=value).
     """
 
     # Input trigger control (CR2[31:16])
@@ -77,6 +85,11 @@ class DPDConfig:
     monitor_window_start: int = 0  # clock cycles
     monitor_window_duration: int = 625000  # clock cycles (5ms @ 125MHz)
 
+    # Register values, built on first to_app_regs_tuples() call (not a field
+    # of the config proper: excluded from __init__, repr and comparisons)
+    _app_regs: Optional[Tuple[Tuple[int, int], ...]] = field(
+        default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validate field values after initialization."""
         # Validate 16-bit signed voltages
@@ -128,9 +141,9 @@ class DPDConfig:
         """
         return (
             ((self.monitor_threshold_voltage & 0xFFFF) << 16) |
-            ((1 if self.auto_rearm_enable else 0) << CR8.AUTO_REARM_ENABLE) |
-            ((1 if self.monitor_expect_negative else 0) << CR8.MONITOR_EXPECT_NEGATIVE) |
-            ((1 if self.monitor_enable else 0) << CR8.MONITOR_ENABLE)
+            (int(self.auto_rearm_enable) << _CR8_AUTO_REARM_SHIFT) |
+            (int(self.monitor_expect_negative) << _CR8_EXPECT_NEGATIVE_SHIFT) |
+            (int(self.monitor_enable) << _CR8_MONITOR_ENABLE_SHIFT)
         )
 
     def _build_cr9(self) -> int:
@@ -150,18 +163,29 @@ class DPDConfig:
         Returns:
             List of {"idx": N, "value": V} dicts for CR2-CR10
         """
-        return [
-            # CR0, CR1 intentionally omitted - handled by adapter
-            {"idx": 2, "value": self._build_cr2()},
-            {"idx": 3, "value": self._build_cr3()},
-            {"idx": 4, "value": self._build_cr4()},
-            {"idx": 5, "value": self._build_cr5()},
-            {"idx": 6, "value": self._build_cr6()},
-            {"idx": 7, "value": self._build_cr7()},
-            {"idx": 8, "value": self._build_cr8()},
-            {"idx": 9, "value": self._build_cr9()},
-            {"idx": 10, "value": self._build_cr10()},
-        ]
+        return [{"idx": idx, "value": value} for idx, value in self.to_app_regs_tuples()]
+
+    def to_app_regs_tuples(self) -> List[Tuple[int, int]]:
+        """Convert configuration to (idx, value) pairs (CR2-CR10 only).
+
+        Returns:
+            List of (N, V) tuples for CR2-CR10
+        """
+        # Config is frozen, so the registers are built once per instance
+        if self._app_regs is None:
+            object.__setattr__(self, "_app_regs", (
+                # CR0, CR1 intentionally omitted - handled by adapter
+                (2, self._build_cr2()),
+                (3, self._build_cr3()),
+                (4, self._build_cr4()),
+                (5, self._build_cr5()),
+                (6, self._build_cr6()),
+                (7, self._build_cr7()),
+                (8, self._build_cr8()),
+                (9, self._build_cr9()),
+                (10, self._build_cr10()),
+            ))
+        return list(self._app_regs)
 
     def __str__(self) -> str:
         """Human-readable string representation."""
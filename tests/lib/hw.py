@@ -14,9 +14,20 @@ API v4.0 Changes:
 import sys
 from pathlib import Path
 
-# Add py_tools to path
+# Add py_tools to path (once - this module is the only lib entry point to it)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "py_tools"))
+_PY_TOOLS = str(PROJECT_ROOT / "py_tools")
+if _PY_TOOLS not in sys.path:
+    sys.path.insert(0, _PY_TOOLS)
+
+__all__ = [
+    'CR0', 'CR1', 'CR8', 'FSMState', 'HVS', 'Platform', 'DefaultTiming',
+    'cr0_build', 'cr0_extract', 'cr8_build',
+    'MCC_CR0_ALL_ENABLED', 'MCC_CR0_FORGE_READY', 'MCC_CR0_USER_ENABLE', 'MCC_CR0_CLK_ENABLE',
+    'HVS_DIGITAL_INITIALIZING', 'HVS_DIGITAL_IDLE', 'HVS_DIGITAL_ARMED',
+    'HVS_DIGITAL_FIRING', 'HVS_DIGITAL_COOLDOWN',
+    'mv_to_digital', 'digital_to_mv', 'digital_to_mv_int',
+]
 
 # Re-export everything from dpd_constants
 from dpd_constants import (
@@ -40,19 +51,30 @@ from dpd_constants import (
     cr8_build,
 )
 
-# Convenience aliases for common values
-MCC_CR0_ALL_ENABLED = CR0.RUN  # 0xE0000000
-MCC_CR0_FORGE_READY = CR0.FORGE_READY_MASK
-MCC_CR0_USER_ENABLE = CR0.USER_ENABLE_MASK
-MCC_CR0_CLK_ENABLE = CR0.CLK_ENABLE_MASK
-
-# HVS digital values for each state
-HVS_DIGITAL_INITIALIZING = HVS.VOLTAGE_INITIALIZING
-HVS_DIGITAL_IDLE = HVS.VOLTAGE_IDLE
-HVS_DIGITAL_ARMED = HVS.VOLTAGE_ARMED
-HVS_DIGITAL_FIRING = HVS.VOLTAGE_FIRING
-HVS_DIGITAL_COOLDOWN = HVS.VOLTAGE_COOLDOWN
-
-# Voltage conversion utilities
-mv_to_digital = HVS.mv_to_digital
-digital_to_mv = HVS.digital_to_mv
+# Convenience aliases, resolved lazily on first access (PEP 562) and then
+# cached as module globals: name -> (source object name, attribute)
+_ALIASES = {
+    'MCC_CR0_ALL_ENABLED': ('CR0', 'RUN'),  # 0xE0000000
+    'MCC_CR0_FORGE_READY': ('CR0', 'FORGE_READY_MASK'),
+    'MCC_CR0_USER_ENABLE': ('CR0', 'USER_ENABLE_MASK'),
+    'MCC_CR0_CLK_ENABLE': ('CR0', 'CLK_ENABLE_MASK'),
+    # HVS digital values for each state
+    'HVS_DIGITAL_INITIALIZING': ('HVS', 'VOLTAGE_INITIALIZING'),
+    'HVS_DIGITAL_IDLE': ('HVS', 'VOLTAGE_IDLE'),
+    'HVS_DIGITAL_ARMED': ('HVS', 'VOLTAGE_ARMED'),
+    'HVS_DIGITAL_FIRING': ('HVS', 'VOLTAGE_FIRING'),
+    'HVS_DIGITAL_COOLDOWN': ('HVS', 'VOLTAGE_COOLDOWN'),
+    # Voltage conversion utilities
+    'mv_to_digital': ('HVS', 'mv_to_digital'),
+    'digital_to_mv': ('HVS', 'digital_to_mv'),
+    'digital_to_mv_int': ('HVS', 'digital_to_mv_int'),
+}
+
+
+def __getattr__(name):
+    target = _ALIASES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(globals()[target[0]], target[1])
+    globals()[name] = value
+    return value
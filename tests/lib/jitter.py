@@ -0,0 +1,46 @@
+"""
+Jitter Pool - Pre-drawn propagation delays for simulated register writes
+========================================================================
+
+Shared by the CocoTB control paths (shared/control_interface.py and
+adapters/cocotb.py) so both draw jitter the same way.
+"""
+
+import random
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+
+class JitterPool:
+    """Jitter delays in cycles, drawn POOL_SIZE at a time.
+
+    Draws from the module-level random generator unless a seed is given,
+    so cocotb's RANDOM_SEED keeps unseeded runs reproducible. The pool is
+    dropped whenever the requested range changes.
+    """
+
+    __slots__ = ("_rng", "_range", "_pool")
+
+    # Jitter delays drawn per refill of the pool
+    POOL_SIZE = 1024
+
+    def __init__(self, seed: Optional[int] = None):
+        """Initialize an empty pool.
+
+        Args:
+            seed: Seed for a private RNG (None = module-level random)
+        """
+        self._rng = random if seed is None else random.Random(seed)
+        self._range: Optional[Tuple[int, int]] = None
+        self._pool: Deque[int] = deque()
+
+    def draw(self, min_cycles: int, max_cycles: int) -> int:
+        """Next delay in [min_cycles, max_cycles], refilling the pool in one draw."""
+        if self._range != (min_cycles, max_cycles):
+            self._range = (min_cycles, max_cycles)
+            self._pool.clear()
+        if not self._pool:
+            self._pool.extend(self._rng.choices(
+                range(min_cycles, max_cycles + 1), k=self.POOL_SIZE
+            ))
+        return self._pool.popleft()
@@ -5,13 +5,21 @@ Common Test Base Classes
 Shared test infrastructure used by both simulation (CocoTB) and hardware (Moku) tests.
 Contains TestLevel, VerbosityLevel, TestResult, and common logging utilities.
 
+Results can be streamed to an append-only JSON-lines file as each test
+completes, so an interrupted run keeps its outcomes and a later run can
+skip tests that already passed (see load_passed_tests).
+
 Author: Moku Instrument Forge Team
 Date: 2025-11-26
 """
 
+import json
 from enum import IntEnum
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import dataclass, asdict
+from typing import Optional, List, Set
+
+# Separator line used by log_separator()
+_SEPARATOR = "=" * 60
 
 
 class TestLevel(IntEnum):
@@ -44,15 +52,39 @@ class VerbosityLevel(IntEnum):
     DEBUG = 4
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestResult:
-    """Single test result record."""
+    """Single test result record (immutable once recorded)."""
     name: str
     passed: bool
     error: Optional[str] = None
     duration_ms: float = 0
 
 
+def load_passed_tests(results_file: str) -> Set[str]:
+    """Read a results file and return the tests whose latest outcome passed.
+
+    Args:
+        results_file: Path to a JSON-lines file written by TestRunnerMixin
+
+    Returns:
+        Set of test names (empty if the file does not exist)
+    """
+    latest = {}
+    try:
+        with open(results_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Truncated last line from an interrupted run
+                if isinstance(record, dict) and "name" in record and "passed" in record:
+                    latest[record["name"]] = record["passed"]
+    except OSError:
+        return set()
+    return {name for name, passed in latest.items() if passed}
+
+
 class TestRunnerMixin:
     """Common test runner logic - mixed into sim/hw base classes.
 
@@ -61,16 +93,85 @@ class TestRunnerMixin:
 
     Subclasses must implement:
     - _log_message(message: str) - Platform-specific logging
+
+    The per-test log methods dispatch through handlers picked once per
+    verbosity level (see the tables below), rather than comparing the
+    verbosity on every call.
     """
 
-    def _init_test_runner(self, verbosity: VerbosityLevel = VerbosityLevel.MINIMAL):
-        """Initialize test runner state. Call from subclass __init__."""
-        self.results: List[TestResult] = []
+    # Verbosity -> handler method name, for each per-test log event
+    _START_HANDLERS = {
+        VerbosityLevel.SILENT: "_log_nothing",
+        VerbosityLevel.MINIMAL: "_start_minimal",
+        VerbosityLevel.NORMAL: "_start_normal",
+        VerbosityLevel.VERBOSE: "_start_verbose",
+        VerbosityLevel.DEBUG: "_start_verbose",
+    }
+    _PASS_HANDLERS = {
+        VerbosityLevel.SILENT: "_log_nothing",
+        VerbosityLevel.MINIMAL: "_pass_minimal",
+        VerbosityLevel.NORMAL: "_pass_normal",
+        VerbosityLevel.VERBOSE: "_pass_verbose",
+        VerbosityLevel.DEBUG: "_pass_verbose",
+    }
+    _FAIL_HANDLERS = {
+        VerbosityLevel.SILENT: "_fail_full",  # Failures always logged
+        VerbosityLevel.MINIMAL: "_fail_minimal",
+        VerbosityLevel.NORMAL: "_fail_full",
+        VerbosityLevel.VERBOSE: "_fail_full",
+        VerbosityLevel.DEBUG: "_fail_full",
+    }
+    _PHASE_HANDLERS = {
+        VerbosityLevel.SILENT: "_log_nothing",
+        VerbosityLevel.MINIMAL: "_phase_minimal",
+        VerbosityLevel.NORMAL: "_phase_full",
+        VerbosityLevel.VERBOSE: "_phase_full",
+        VerbosityLevel.DEBUG: "_phase_full",
+    }
+
+    def _init_test_runner(self, verbosity: VerbosityLevel = VerbosityLevel.MINIMAL,
+                          results_file: Optional[str] = None):
+        """Initialize test runner state. Call from subclass __init__.
+
+        Args:
+            verbosity: Output verbosity
+            results_file: Optional JSON-lines file to append each result to
+        """
+        # Only failures are kept: passes are counted (and streamed to the
+        # results file), but never re-read, so long runs don't grow a list
+        self.failed_results: List[TestResult] = []
         self.test_count = 0
         self.passed_count = 0
         self.failed_count = 0
         self.verbosity = verbosity
         self.current_phase: Optional[str] = None
+        # Line-buffered so every completed test survives an interrupted run
+        self._results_stream = (
+            open(results_file, "a", buffering=1, encoding="utf-8") if results_file else None
+        )
+
+    @property
+    def verbosity(self) -> VerbosityLevel:
+        """Output verbosity. Setting it re-selects the log handlers."""
+        return self._verbosity
+
+    @verbosity.setter
+    def verbosity(self, level: VerbosityLevel):
+        self._verbosity = level
+        key = min(level, VerbosityLevel.DEBUG)
+        self._on_test_start = getattr(self, self._START_HANDLERS[key])
+        self._on_test_pass = getattr(self, self._PASS_HANDLERS[key])
+        self._on_test_fail = getattr(self, self._FAIL_HANDLERS[key])
+        self._on_phase_start = getattr(self, self._PHASE_HANDLERS[key])
+        # At SILENT only level-SILENT messages pass log()/log_separator(), so
+        # shadow them with handlers that skip the comparison for the usual
+        # (higher) levels; otherwise fall back to the class methods
+        if level == VerbosityLevel.SILENT:
+            self.log = self._log_silent
+            self.log_separator = self._separator_silent
+        else:
+            self.__dict__.pop("log", None)
+            self.__dict__.pop("log_separator", None)
 
     def _log_message(self, message: str):
         """Log a message. Override in subclass for platform-specific logging."""
@@ -87,73 +188,93 @@ class TestRunnerMixin:
             message: Message to log
             level: Required verbosity level for this message
         """
-        if self.verbosity >= level:
+        if self._verbosity >= level:
             self._log_message(message)
 
     def log_separator(self, level: VerbosityLevel = VerbosityLevel.NORMAL):
         """Log a separator line."""
-        self.log("=" * 60, level)
+        if self._verbosity >= level:
+            self._log_message(_SEPARATOR)
 
     def log_test_start(self, test_name: str):
         """Log test start based on verbosity."""
         self.test_count += 1
-
-        if self.verbosity == VerbosityLevel.SILENT:
-            pass  # No output
-        elif self.verbosity == VerbosityLevel.MINIMAL:
-            self._log_message(f"T{self.test_count}: {test_name}")
-        elif self.verbosity == VerbosityLevel.NORMAL:
-            self.log_separator()
-            self._log_message(f"Test {self.test_count}: {test_name}")
-        else:  # VERBOSE or DEBUG
-            self.log_separator()
-            self._log_message(f"Test {self.test_count}: {test_name}")
-            self.log_separator()
+        self._on_test_start(test_name)
 
     def log_test_pass(self, test_name: str, duration_ms: float = 0):
         """Log test pass."""
         self.passed_count += 1
-
-        if self.verbosity == VerbosityLevel.SILENT:
-            pass
-        elif self.verbosity == VerbosityLevel.MINIMAL:
-            self._log_message("  ✓ PASS")
-        elif self.verbosity == VerbosityLevel.NORMAL:
-            if duration_ms > 0:
-                self._log_message(f"✓ {test_name} PASSED ({duration_ms:.0f}ms)")
-            else:
-                self._log_message(f"✓ {test_name} PASSED")
-        else:
-            if duration_ms > 0:
-                self._log_message(f"✓ {test_name} PASSED ({duration_ms:.1f}ms)")
-            else:
-                self._log_message(f"✓ {test_name} PASSED")
+        self._on_test_pass(test_name, duration_ms)
 
     def log_test_fail(self, test_name: str, error: str, duration_ms: float = 0):
         """Log test failure."""
         self.failed_count += 1
-
         # Always log failures regardless of verbosity
-        if self.verbosity == VerbosityLevel.MINIMAL:
-            self._log_error(f"  ✗ FAIL: {error}")
-        else:
-            if duration_ms > 0:
-                self._log_error(f"✗ {test_name} FAILED ({duration_ms:.0f}ms): {error}")
-            else:
-                self._log_error(f"✗ {test_name} FAILED: {error}")
+        self._on_test_fail(test_name, error, duration_ms)
 
     def log_phase_start(self, phase_name: str):
         """Log phase start (P1, P2, etc.)."""
         self.current_phase = phase_name
+        self._on_phase_start(phase_name)
 
-        if self.verbosity == VerbosityLevel.SILENT:
-            pass
-        elif self.verbosity == VerbosityLevel.MINIMAL:
-            self._log_message(f"\n{phase_name}")
+    # -------------------------------------------------------------------------
+    # Per-verbosity log handlers (selected by the verbosity setter)
+    # -------------------------------------------------------------------------
+
+    def _log_nothing(self, *args):
+        """Handler for events not shown at this verbosity."""
+
+    def _log_silent(self, message: str, level: VerbosityLevel = VerbosityLevel.NORMAL):
+        if level <= VerbosityLevel.SILENT:
+            self._log_message(message)
+
+    def _separator_silent(self, level: VerbosityLevel = VerbosityLevel.NORMAL):
+        if level <= VerbosityLevel.SILENT:
+            self._log_message(_SEPARATOR)
+
+    def _start_minimal(self, test_name: str):
+        self._log_message(f"T{self.test_count}: {test_name}")
+
+    def _start_normal(self, test_name: str):
+        self.log_separator()
+        self._log_message(f"Test {self.test_count}: {test_name}")
+
+    def _start_verbose(self, test_name: str):
+        self.log_separator()
+        self._log_message(f"Test {self.test_count}: {test_name}")
+        self.log_separator()
+
+    def _pass_minimal(self, test_name: str, duration_ms: float):
+        self._log_message("  ✓ PASS")
+
+    def _pass_normal(self, test_name: str, duration_ms: float):
+        if duration_ms > 0:
+            self._log_message(f"✓ {test_name} PASSED ({duration_ms:.0f}ms)")
+        else:
+            self._log_message(f"✓ {test_name} PASSED")
+
+    def _pass_verbose(self, test_name: str, duration_ms: float):
+        if duration_ms > 0:
+            self._log_message(f"✓ {test_name} PASSED ({duration_ms:.1f}ms)")
         else:
-            self.log_separator(VerbosityLevel.NORMAL)
-            self._log_message(f"PHASE: {phase_name}")
-            self.log_separator(VerbosityLevel.NORMAL)
+            self._log_message(f"✓ {test_name} PASSED")
+
+    def _fail_minimal(self, test_name: str, error: str, duration_ms: float):
+        self._log_error(f"  ✗ FAIL: {error}")
+
+    def _fail_full(self, test_name: str, error: str, duration_ms: float):
+        if duration_ms > 0:
+            self._log_error(f"✗ {test_name} FAILED ({duration_ms:.0f}ms): {error}")
+        else:
+            self._log_error(f"✗ {test_name} FAILED: {error}")
+
+    def _phase_minimal(self, phase_name: str):
+        self._log_message(f"\n{phase_name}")
+
+    def _phase_full(self, phase_name: str):
+        self.log_separator(VerbosityLevel.NORMAL)
+        self._log_message(f"PHASE: {phase_name}")
+        self.log_separator(VerbosityLevel.NORMAL)
 
     def log_summary(self):
         """Log test summary."""
@@ -178,9 +299,8 @@ class TestRunnerMixin:
             # Show failed tests
             if self.failed_count > 0 and self.verbosity >= VerbosityLevel.NORMAL:
                 self._log_message("\nFailed tests:")
-                for result in self.results:
-                    if not result.passed:
-                        self._log_error(f"  - {result.name}: {result.error}")
+                for result in self.failed_results:
+                    self._log_error(f"  - {result.name}: {result.error}")
 
             self.log_separator()
 
@@ -198,5 +318,19 @@ class TestRunnerMixin:
 
     def add_result(self, name: str, passed: bool, error: Optional[str] = None,
                    duration_ms: float = 0):
-        """Add a test result to the results list."""
-        self.results.append(TestResult(name, passed, error, duration_ms))
+        """Record a test result.
+
+        Failures are kept for the summary; every result is appended to the
+        results file, if set.
+        """
+        result = TestResult(name, passed, error, duration_ms)
+        if not passed:
+            self.failed_results.append(result)
+        if self._results_stream is not None:
+            self._results_stream.write(json.dumps(asdict(result)) + "\n")
+
+    def close_results(self):
+        """Close the results file, if one is open. Safe to call twice."""
+        if self._results_stream is not None:
+            self._results_stream.close()
+            self._results_stream = None
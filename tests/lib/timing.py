@@ -9,9 +9,17 @@ These are TEST configurations, not production defaults.
 Production defaults are in py_tools/dpd_constants.py (DefaultTiming).
 """
 
-from .clk import cycles_to_us
+from .clk import DEFAULT_CLK_FREQ_HZ
 from .hw import HVS
 
+# Clock cycles per microsecond, for the *_US reference values below
+_CYCLES_PER_US = DEFAULT_CLK_FREQ_HZ / 1_000_000
+
+
+def _cycles_to_us_all(*cycles):
+    """Convert several cycle counts to microseconds in one pass."""
+    return tuple(c / _CYCLES_PER_US for c in cycles)
+
 
 class _TestTimingBase:
     """Base class with shared trigger/voltage values for all test timing levels."""
@@ -20,9 +28,10 @@ class _TestTimingBase:
     TRIGGER_THRESHOLD_MV = 950
     TRIGGER_TEST_VOLTAGE_MV = 1500
 
-    # Trigger threshold as digital values
-    TRIGGER_THRESHOLD_DIGITAL = HVS.mv_to_digital(950)
-    TRIGGER_TEST_VOLTAGE_DIGITAL = HVS.mv_to_digital(1500)
+    # Trigger threshold as digital values, folded with integer math
+    # (same result as HVS.mv_to_digital() for positive whole mV)
+    TRIGGER_THRESHOLD_DIGITAL = (TRIGGER_THRESHOLD_MV * HVS.DIGITAL_MAX) // HVS.V_MAX_MV        # 6225
+    TRIGGER_TEST_VOLTAGE_DIGITAL = (TRIGGER_TEST_VOLTAGE_MV * HVS.DIGITAL_MAX) // HVS.V_MAX_MV  # 9830
 
     # Output voltages (mV)
     TRIG_OUT_VOLTAGE_MV = 2000
@@ -47,10 +56,9 @@ class P1Timing(_TestTimingBase):
     TOTAL_CYCLES = TRIG_OUT_DURATION + INTENSITY_DURATION + COOLDOWN_INTERVAL
 
     # Timing in microseconds (for reference)
-    TRIG_OUT_DURATION_US = cycles_to_us(TRIG_OUT_DURATION)
-    INTENSITY_DURATION_US = cycles_to_us(INTENSITY_DURATION)
-    COOLDOWN_INTERVAL_US = cycles_to_us(COOLDOWN_INTERVAL)
-    TOTAL_US = cycles_to_us(TOTAL_CYCLES)
+    TRIG_OUT_DURATION_US, INTENSITY_DURATION_US, COOLDOWN_INTERVAL_US, TOTAL_US = (
+        _cycles_to_us_all(TRIG_OUT_DURATION, INTENSITY_DURATION, COOLDOWN_INTERVAL, TOTAL_CYCLES)
+    )
 
 
 class P2Timing(_TestTimingBase):
@@ -71,10 +79,9 @@ class P2Timing(_TestTimingBase):
     TOTAL_CYCLES = TRIG_OUT_DURATION + INTENSITY_DURATION + COOLDOWN_INTERVAL
 
     # Timing in microseconds (for reference)
-    TRIG_OUT_DURATION_US = cycles_to_us(TRIG_OUT_DURATION)
-    INTENSITY_DURATION_US = cycles_to_us(INTENSITY_DURATION)
-    COOLDOWN_INTERVAL_US = cycles_to_us(COOLDOWN_INTERVAL)
-    TOTAL_US = cycles_to_us(TOTAL_CYCLES)
+    TRIG_OUT_DURATION_US, INTENSITY_DURATION_US, COOLDOWN_INTERVAL_US, TOTAL_US = (
+        _cycles_to_us_all(TRIG_OUT_DURATION, INTENSITY_DURATION, COOLDOWN_INTERVAL, TOTAL_CYCLES)
+    )
 
 
 # Default trigger wait timeout (shared)
@@ -14,4 +14,7 @@ SIM_HVS_TOLERANCE = 200  # +/-200 digital units (~30mV)
 
 # Hardware tolerance (looser - ADC noise, polling latency)
 HW_HVS_TOLERANCE_V = 0.30  # +/-300mV
-HW_HVS_TOLERANCE_DIGITAL = HVS.mv_to_digital(int(HW_HVS_TOLERANCE_V * 1000))
+# Same as HVS.mv_to_digital() for the whole-mV tolerance, in integer math
+HW_HVS_TOLERANCE_DIGITAL = (
+    round(HW_HVS_TOLERANCE_V * 1000) * HVS.DIGITAL_MAX
+) // HVS.V_MAX_MV  # 1966
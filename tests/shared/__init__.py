@@ -16,3 +16,5 @@ from .control_interface import (
     CocoTBControl,
     MokuControl,
 )
+
+__all__ = ['ControlInterface', 'CocoTBControl', 'MokuControl']
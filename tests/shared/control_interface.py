@@ -41,19 +41,46 @@ Date: 2025-11-26
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional, TYPE_CHECKING
 import sys
-import time
-import random
 from pathlib import Path
 
-# Add py_tools to path for DPDConfig
+# Add py_tools to path for DPDConfig (once, not on every import)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "py_tools"))
+_PY_TOOLS = str(PROJECT_ROOT / "py_tools")
+if _PY_TOOLS not in sys.path:
+    sys.path.insert(0, _PY_TOOLS)
+_TESTS = str(PROJECT_ROOT / "tests")
+if _TESTS not in sys.path:
+    sys.path.insert(0, _TESTS)
 
 from dpd_constants import CR0
+from lib import JitterPool
+
+# Resolved once at import; MokuControl users need not have cocotb installed
+try:
+    from cocotb.triggers import ClockCycles
+except ImportError:
+    ClockCycles = None
 
 if TYPE_CHECKING:
+    import numpy as np
     from dpd_config import DPDConfig
 
+# CR0 values written by enable_forge() / disable_forge()
+_CR0_ALL_ENABLED = CR0.ALL_ENABLED
+_CR0_DISABLED = 0x00000000
+
+# set_controls() batch written by clear_app_regs(): CR1-CR10 = 0
+_CLEAR_APP_REGS = [{"idx": idx, "value": 0} for idx in range(1, 11)]
+
+# CR0 FORGE bits for every (forge_ready, user_enable, clk_enable) combination,
+# indexed by forge_ready << 2 | user_enable << 1 | clk_enable
+_FORGE_MASK_LUT = tuple(
+    (CR0.FORGE_READY_MASK if b & 4 else 0) |
+    (CR0.USER_ENABLE_MASK if b & 2 else 0) |
+    (CR0.CLK_ENABLE_MASK if b & 1 else 0)
+    for b in range(8)
+)
+
 
 class ControlInterface(ABC):
     """Abstract interface matching CloudCompile control API semantics.
@@ -65,6 +92,8 @@ class ControlInterface(ABC):
         ctrl.set_controls(config.to_app_regs_list())
     """
 
+    __slots__ = ()
+
     # =========================================================================
     # Abstract Methods - Must be implemented by subclasses
     # =========================================================================
@@ -107,8 +136,9 @@ class ControlInterface(ABC):
         Args:
             controls: List of {"idx": N, "value": V} dicts
         """
+        set_control = self.set_control
         for ctrl in controls:
-            self.set_control(ctrl["idx"], ctrl["value"])
+            set_control(ctrl["idx"], ctrl["value"])
 
     def get_controls(self, indices: Optional[List[int]] = None) -> List[Dict[str, int]]:
         """Read multiple control registers.
@@ -123,6 +153,29 @@ class ControlInterface(ABC):
             indices = list(range(11))  # CR0-CR10
         return [{"idx": idx, "value": self.get_control(idx)} for idx in indices]
 
+    def get_controls_array(self, indices: Optional[List[int]] = None) -> "np.ndarray":
+        """Read multiple control registers into a uint32 array.
+
+        Values-only counterpart of get_controls() for snapshots that are
+        compared or diffed as a whole (e.g. np.array_equal(before, after)).
+
+        Args:
+            indices: List of register indices to read (default: 0-10)
+
+        Returns:
+            uint32 array of register values, in the order of indices
+        """
+        import numpy as np  # Only this method needs numpy
+
+        if indices is None:
+            indices = range(11)  # CR0-CR10
+        get_control = self.get_control
+        return np.fromiter(
+            (get_control(idx) & 0xFFFFFFFF for idx in indices),
+            dtype=np.uint32,
+            count=len(indices),
+        )
+
     # =========================================================================
     # FORGE Control (CR0) - System Layer
     # =========================================================================
@@ -133,14 +186,14 @@ class ControlInterface(ABC):
         Sets forge_ready, user_enable, and clk_enable bits.
         This is REQUIRED for the FSM to operate.
         """
-        self.set_control(0, CR0.ALL_ENABLED)
+        return self.set_control(0, _CR0_ALL_ENABLED)
 
     def disable_forge(self):
         """Disable FORGE control (CR0 = 0).
 
         Clears all FORGE control bits. FSM will freeze.
         """
-        self.set_control(0, 0x00000000)
+        return self.set_control(0, _CR0_DISABLED)
 
     def set_forge_partial(self, forge_ready: bool = False,
                           user_enable: bool = False,
@@ -152,14 +205,8 @@ class ControlInterface(ABC):
             user_enable: CR0[30] - User control enable
             clk_enable: CR0[29] - Clock gating enable
         """
-        value = 0
-        if forge_ready:
-            value |= CR0.FORGE_READY_MASK
-        if user_enable:
-            value |= CR0.USER_ENABLE_MASK
-        if clk_enable:
-            value |= CR0.CLK_ENABLE_MASK
-        self.set_control(0, value)
+        index = bool(forge_ready) << 2 | bool(user_enable) << 1 | bool(clk_enable)
+        return self.set_control(0, _FORGE_MASK_LUT[index])
 
     # =========================================================================
     # Application Configuration (CR1-CR10)
@@ -177,16 +224,19 @@ class ControlInterface(ABC):
         Example:
             ctrl.enable_forge()
             ctrl.apply_config(DPDConfig(arm_enable=True, ...))
+
+        Returns whatever set_controls() returns, so on CocoTBControl
+        (async set_controls) the call must be awaited.
         """
-        self.set_controls(config.to_app_regs_list())
+        return self.set_controls(config.to_app_regs_list())
 
     def clear_app_regs(self):
         """Clear all application registers (CR1-CR10) to zero.
 
-        Useful for resetting state between tests.
+        Useful for resetting state between tests. Issued as one
+        set_controls() batch (a single network write on MokuControl).
         """
-        for idx in range(1, 11):
-            self.set_control(idx, 0)
+        return self.set_controls(_CLEAR_APP_REGS)
 
 
 class CocoTBControl(ControlInterface):
@@ -199,6 +249,8 @@ class CocoTBControl(ControlInterface):
     cycle-exact timing that doesn't exist in hardware.
     """
 
+    __slots__ = ("dut", "_shadow_regs", "_ctrl_sigs", "_jitter")
+
     # Propagation jitter range (cycles at 125MHz)
     JITTER_MIN_CYCLES = 10   # 80ns minimum
     JITTER_MAX_CYCLES = 50   # 400ns maximum
@@ -211,6 +263,24 @@ class CocoTBControl(ControlInterface):
         """
         self.dut = dut
         self._shadow_regs = {}  # Track writes for get_control()
+        # Control0-Control15 signal handles, resolved once (None if absent)
+        self._ctrl_sigs = [getattr(dut, f"Control{i}", None) for i in range(16)]
+        self._jitter = JitterPool()
+
+    def _signal(self, idx: int):
+        """Cached Control{idx} handle; AttributeError if not on the DUT."""
+        sig = self._ctrl_sigs[idx] if 0 <= idx < len(self._ctrl_sigs) else None
+        if sig is None:
+            raise AttributeError(f"DUT has no control signal Control{idx}")
+        return sig
+
+    def _next_jitter(self) -> int:
+        """Next propagation jitter in cycles.
+
+        Draws from the module-level random generator, so cocotb's
+        RANDOM_SEED still makes runs reproducible.
+        """
+        return self._jitter.draw(self.JITTER_MIN_CYCLES, self.JITTER_MAX_CYCLES)
 
     async def set_control(self, idx: int, value: int):
         """Set control register on DUT with propagation jitter.
@@ -222,15 +292,33 @@ class CocoTBControl(ControlInterface):
             idx: Register index (0-15)
             value: 32-bit register value
         """
-        from cocotb.triggers import ClockCycles
+        if ClockCycles is None:
+            raise RuntimeError("cocotb is required for CocoTBControl")
 
         # Write the value immediately
-        getattr(self.dut, f"Control{idx}").value = value
+        self._signal(idx).value = value
         self._shadow_regs[idx] = value
 
         # Add random jitter to model network propagation
-        jitter = random.randint(self.JITTER_MIN_CYCLES, self.JITTER_MAX_CYCLES)
-        await ClockCycles(self.dut.Clk, jitter)
+        await ClockCycles(self.dut.Clk, self._next_jitter())
+
+    async def set_controls(self, controls: List[Dict[str, int]]):
+        """Set multiple control registers with a single propagation jitter.
+
+        All DUT signals are written first, then one jitter wait models the
+        propagation of the whole batch (instead of one wait per register).
+
+        Args:
+            controls: List of {"idx": N, "value": V} dicts
+        """
+        if ClockCycles is None:
+            raise RuntimeError("cocotb is required for CocoTBControl")
+
+        for ctrl in controls:
+            self._signal(ctrl["idx"]).value = ctrl["value"]
+            self._shadow_regs[ctrl["idx"]] = ctrl["value"]
+
+        await ClockCycles(self.dut.Clk, self._next_jitter())
 
     def get_control(self, idx: int) -> int:
         """Read control register from shadow (matches hardware behavior).
@@ -259,7 +347,7 @@ class CocoTBControl(ControlInterface):
         Returns:
             Current DUT signal value
         """
-        return int(getattr(self.dut, f"Control{idx}").value)
+        return self._signal(idx).value.to_unsigned()
 
 
 class MokuControl(ControlInterface):
@@ -271,6 +359,8 @@ class MokuControl(ControlInterface):
     set_control() is synchronous and blocks on network I/O (~100ms typical).
     """
 
+    __slots__ = ("mcc", "_shadow_regs")
+
     def __init__(self, mcc):
         """Initialize with CloudCompile instrument.
 
@@ -318,5 +408,4 @@ class MokuControl(ControlInterface):
         """
         self.mcc.set_controls(controls)
         # Update shadow registers
-        for ctrl in controls:
-            self._shadow_regs[ctrl["idx"]] = ctrl["value"]
+        self._shadow_regs.update({ctrl["idx"]: ctrl["value"] for ctrl in controls})
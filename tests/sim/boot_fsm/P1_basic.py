@@ -25,7 +25,8 @@ from pathlib import Path
 
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 from py_tools.boot_constants import (
     CMD, BOOTState, BOOT_HVS,
@@ -69,7 +70,7 @@ async def setup_dut(dut):
 
 def get_output_c(dut) -> int:
     """Get OutputC as signed integer."""
-    return dut.OutputC.value.signed_integer
+    return dut.OutputC.value.to_signed()
 
 
 def assert_state(dut, expected_name: str, expected_digital: int, context: str = ""):
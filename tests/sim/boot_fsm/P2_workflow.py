@@ -22,9 +22,16 @@ from cocotb.triggers import RisingEdge, ClockCycles
 import sys
 from pathlib import Path
 
-# Add project root to path for imports
+# Add project root (py_tools) and tests/sim (conftest) to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+SIM_PATH = Path(__file__).parent.parent
+for _path in (PROJECT_ROOT, SIM_PATH):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from conftest import (
+    PRE_PROG_HVS_TOLERANCE, get_output_c, assert_state_approx, wait_for_state,
+)
 
 from py_tools.boot_constants import (
     CMD, encode_pre_prog,
@@ -44,13 +51,26 @@ BIOS_DIGITAL_IDLE = encode_pre_prog(BIOS_HVS_S_IDLE, 0)
 BIOS_DIGITAL_RUN = encode_pre_prog(BIOS_HVS_S_RUN, 0)
 BIOS_DIGITAL_DONE = encode_pre_prog(BIOS_HVS_S_DONE, 0)
 
-# Tolerance for simulation
-SIM_HVS_TOLERANCE = 150
+# Tolerance for simulation (the conftest helpers' default)
+SIM_HVS_TOLERANCE = PRE_PROG_HVS_TOLERANCE
 
 # Clock period (8ns = 125MHz)
 CLK_PERIOD_NS = 8
 
 
+# Control0..Control15 handles, looked up on the first setup_dut (the DUT
+# object is the same for every test in a simulation run)
+_CTRL_HANDLES = None
+
+
+def _control_handles(dut):
+    """Return the cached Control0..Control15 handles."""
+    global _CTRL_HANDLES
+    if _CTRL_HANDLES is None:
+        _CTRL_HANDLES = [getattr(dut, f"Control{i}") for i in range(16)]
+    return _CTRL_HANDLES
+
+
 async def setup_dut(dut):
     """Initialize DUT with clock and reset."""
     cocotb.start_soon(Clock(dut.Clk, CLK_PERIOD_NS, unit="ns").start())
@@ -60,8 +80,8 @@ async def setup_dut(dut):
     dut.InputA.value = 0
     dut.InputB.value = 0
     dut.InputC.value = 0
-    for i in range(16):
-        getattr(dut, f"Control{i}").value = 0
+    for handle in _control_handles(dut):
+        handle.value = 0
 
     # Hold reset for 10 cycles
     await ClockCycles(dut.Clk, 10)
@@ -71,38 +91,6 @@ async def setup_dut(dut):
     await ClockCycles(dut.Clk, 2)
 
 
-def get_output_c(dut) -> int:
-    """Get OutputC as signed integer."""
-    return dut.OutputC.value.to_signed()
-
-
-def assert_state_approx(dut, expected_name: str, expected_digital: int, context: str = ""):
-    """Assert OutputC is within tolerance of expected HVS value."""
-    actual = get_output_c(dut)
-    diff = abs(actual - expected_digital)
-
-    assert diff <= SIM_HVS_TOLERANCE, (
-        f"State mismatch{' (' + context + ')' if context else ''}: "
-        f"expected {expected_name} ({expected_digital}), "
-        f"got {actual} (diff={diff})"
-    )
-
-
-async def wait_for_state(dut, expected_name: str, expected_digital: int,
-                         max_cycles: int = 100, context: str = ""):
-    """Wait for OutputC to reach expected state, polling each cycle."""
-    for _ in range(max_cycles):
-        actual = get_output_c(dut)
-        if abs(actual - expected_digital) <= SIM_HVS_TOLERANCE:
-            return True
-        await ClockCycles(dut.Clk, 1)
-
-    # Timeout - assert will fail
-    assert_state_approx(dut, expected_name, expected_digital,
-                        f"{context} (timeout after {max_cycles} cycles)")
-    return False
-
-
 @cocotb.test()
 async def test_boot_loader_auto_advance(dut):
     """Verify LOADER auto-advances P0→P1→P2→P3 in validation mode.
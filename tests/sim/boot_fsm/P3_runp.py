@@ -22,9 +22,16 @@ from cocotb.triggers import RisingEdge, ClockCycles
 import sys
 from pathlib import Path
 
-# Add project root to path for imports
+# Add project root (py_tools) and tests/sim (conftest) to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+SIM_PATH = Path(__file__).parent.parent
+for _path in (PROJECT_ROOT, SIM_PATH):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from conftest import (
+    get_output_c, assert_state_approx, wait_for_state,
+)
 
 from py_tools.boot_constants import (
     CMD, BOOTState, BOOT_HVS,
@@ -41,26 +48,36 @@ BOOT_DIGITAL_P1 = encode_pre_prog(BOOT_HVS_S_P1, 0)  # S=1: 197
 # DPD HVS digital values (PROG encoding: 3277 units/state)
 DPD_DIGITAL_IDLE = HVS.VOLTAGE_IDLE  # S=1: 3277 (~0.5V)
 
-# Tolerance for simulation (tighter than HW)
-BOOT_SIM_HVS_TOLERANCE = 150  # +/-150 digital units (~23mV)
+# Tolerance for simulation (tighter than HW); pre-PROG levels use the
+# conftest default (PRE_PROG_HVS_TOLERANCE, +/-150 digital units)
 DPD_SIM_HVS_TOLERANCE = 300   # +/-300 digital units (~45mV)
 
 # Clock period (8ns = 125MHz)
 CLK_PERIOD_NS = 8
 
 
+# Control0..Control4 (the LOADER protocol registers), looked up on the
+# first setup_dut (the DUT object is the same for every test in a run)
+_CTRL_HANDLES = None
+
+
+def _control_handles(dut):
+    """Return the cached Control0..Control4 handles."""
+    global _CTRL_HANDLES
+    if _CTRL_HANDLES is None:
+        _CTRL_HANDLES = [getattr(dut, f"Control{i}") for i in range(5)]
+    return _CTRL_HANDLES
+
+
 async def setup_dut(dut):
     """Initialize DUT with clock and reset."""
     # Start clock
-    cocotb.start_soon(Clock(dut.Clk, CLK_PERIOD_NS, units="ns").start())
+    cocotb.start_soon(Clock(dut.Clk, CLK_PERIOD_NS, unit="ns").start())
 
     # Apply reset
     dut.Reset.value = 1
-    dut.Control0.value = 0
-    dut.Control1.value = 0
-    dut.Control2.value = 0
-    dut.Control3.value = 0
-    dut.Control4.value = 0
+    for handle in _control_handles(dut):
+        handle.value = 0
     dut.InputA.value = 0
     dut.InputB.value = 0
     await ClockCycles(dut.Clk, 5)
@@ -70,41 +87,6 @@ async def setup_dut(dut):
     await ClockCycles(dut.Clk, 5)
 
 
-def get_output_c(dut):
-    """Get OutputC value as signed integer."""
-    return dut.OutputC.value.signed_integer
-
-
-def assert_state_approx(dut, expected_name, expected_digital, context="", tolerance=BOOT_SIM_HVS_TOLERANCE):
-    """Assert OutputC is within tolerance of expected digital value."""
-    actual = get_output_c(dut)
-    diff = abs(actual - expected_digital)
-    assert diff <= tolerance, (
-        f"State mismatch{' (' + context + ')' if context else ''}: "
-        f"expected {expected_name} ({expected_digital}), "
-        f"got {actual} (diff={diff}, tolerance={tolerance})"
-    )
-
-
-async def wait_for_state(dut, expected_name, expected_digital, max_cycles=50, context="", tolerance=BOOT_SIM_HVS_TOLERANCE):
-    """Wait for DUT to reach expected state within max_cycles."""
-    for cycle in range(max_cycles):
-        actual = get_output_c(dut)
-        diff = abs(actual - expected_digital)
-        if diff <= tolerance:
-            dut._log.info(f"Reached {expected_name} after {cycle+1} cycles")
-            return
-        await ClockCycles(dut.Clk, 1)
-
-    # Final check with detailed error message
-    actual = get_output_c(dut)
-    diff = abs(actual - expected_digital)
-    assert False, (
-        f"Timeout waiting for {expected_name}{' (' + context + ')' if context else ''}: "
-        f"expected {expected_digital}, got {actual} (diff={diff}) after {max_cycles} cycles"
-    )
-
-
 @cocotb.test()
 async def test_boot_runp_handoff(dut):
     """Verify BOOT → PROG handoff via RUNP command."""
@@ -13,6 +13,10 @@ Environment Variables:
     TEST_MODULE: Test module to run (default: boot_fsm.P1_basic)
     WAVES: Enable waveform capture (true/false, default: false)
     GHDL_FILTER: Output filter level (aggressive, normal, minimal, none)
+    IEEE_ASSERTS: Keep GHDL's numeric_std/std_logic assertions (true/false,
+                  default: false - they only flag metavalues around reset)
+    COCOTB_ENABLE_PROFILING: Profile the Python test code (cocotb writes
+                             test_profile.pstat); inherited by the simulator
 
 Future Vision:
     The BOOT FSM's command structure (RUN/RUNL/RUNB/RUNP/RET) naturally
@@ -40,7 +44,9 @@ from pathlib import Path
 os.chdir(Path(__file__).parent)
 
 # Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_TESTS_PATH = str(Path(__file__).parent.parent)
+if _TESTS_PATH not in sys.path:
+    sys.path.insert(0, _TESTS_PATH)
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent  # DPD-001/
@@ -72,6 +78,14 @@ def main():
     # Simulator
     sim = os.environ.get("SIM", "ghdl")
 
+    # GHDL runtime options: IEEE library assertions are checked on every
+    # numeric_std call, so they are off unless asked for
+    ieee_asserts = os.environ.get("IEEE_ASSERTS", "false").lower() == "true"
+    sim_args = [] if sim != "ghdl" or ieee_asserts else ["--ieee-asserts=disable"]
+
+    # Read by cocotb itself in the simulator process (environment is inherited)
+    profiling = bool(os.environ.get("COCOTB_ENABLE_PROFILING"))
+
     print("=" * 70)
     print("BOOT Subsystem Test Runner")
     print("=" * 70)
@@ -79,6 +93,7 @@ def main():
     print(f"Top-level: {HDL_TOPLEVEL}")
     print(f"Test Module: {test_module}")
     print(f"Waveforms: {'Enabled' if waves else 'Disabled'}")
+    print(f"Profiling: {'Enabled' if profiling else 'Disabled'}")
     print(f"Sources: {len(HDL_SOURCES)} VHDL files")
     print("=" * 70)
 
@@ -101,6 +116,7 @@ def main():
             simulator=sim,
             waves=waves,
             extra_args=["--std=08"],
+            sim_args=sim_args,
         )
 
         print(f"\n✅ BOOT tests completed successfully!")
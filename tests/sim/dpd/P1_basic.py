@@ -25,8 +25,9 @@ from pathlib import Path
 
 # Add paths for imports
 TESTS_PATH = Path(__file__).parent.parent
-sys.path.insert(0, str(TESTS_PATH))
-sys.path.insert(0, str(TESTS_PATH.parent))
+for _path in (TESTS_PATH, TESTS_PATH.parent):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
 
 from test_base import TestBase
 from adapters.cocotb import CocoTBAsyncHarness
@@ -265,20 +266,16 @@ class DPDBasicTests(TestBase):
 
     async def _configure_timing(self):
         """Configure timing registers with P1 (fast) values."""
-        ctrl = self.harness.controller
-        await ctrl.set_control_register(4, P1Timing.TRIG_OUT_DURATION)
-        await ctrl.set_control_register(5, P1Timing.INTENSITY_DURATION)
-        await ctrl.set_control_register(6, DEFAULT_TRIGGER_WAIT_TIMEOUT)
-        await ctrl.set_control_register(7, P1Timing.COOLDOWN_INTERVAL)
+        await self.harness.controller.configure_timing(
+            trig_duration=P1Timing.TRIG_OUT_DURATION,
+            intensity_duration=P1Timing.INTENSITY_DURATION,
+            cooldown=P1Timing.COOLDOWN_INTERVAL,
+            timeout=DEFAULT_TRIGGER_WAIT_TIMEOUT,
+        )
 
     async def _wait_for_cycle_complete(self):
         """Wait for FSM to complete FIRING + COOLDOWN."""
-        total_cycles = (
-            P1Timing.TRIG_OUT_DURATION +
-            P1Timing.INTENSITY_DURATION +
-            P1Timing.COOLDOWN_INTERVAL +
-            200  # margin
-        )
+        total_cycles = P1Timing.TOTAL_CYCLES + 200  # margin
         await self.harness.controller.wait_cycles(total_cycles)
 
 
@@ -41,7 +41,9 @@ from contextlib import contextmanager
 os.chdir(Path(__file__).parent)
 
 # Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_TESTS_PATH = str(Path(__file__).parent.parent)
+if _TESTS_PATH not in sys.path:
+    sys.path.insert(0, _TESTS_PATH)
 
 # HDL configuration (previously in dpd/constants.py)
 PROJECT_ROOT = Path(__file__).parent.parent.parent  # DPD-001/
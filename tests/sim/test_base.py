@@ -19,7 +19,8 @@ from pathlib import Path
 
 # Add shared module to path
 TESTS_PATH = Path(__file__).parent.parent
-sys.path.insert(0, str(TESTS_PATH))
+if str(TESTS_PATH) not in sys.path:
+    sys.path.insert(0, str(TESTS_PATH))
 
 # Import from lib (unified test infrastructure)
 from lib import (
@@ -27,11 +28,21 @@ from lib import (
     VerbosityLevel,
     TestResult,
     TestRunnerMixin,
+    load_passed_tests,
 )
 
 # Re-export for backward compatibility
 __all__ = ['TestLevel', 'VerbosityLevel', 'TestResult', 'TestBase', 'get_test_runner']
 
+# Test phases in run order: (level, runner method, phase banner). Sorted by
+# level, so a run stops at the first phase above the configured level.
+_PHASES = (
+    (TestLevel.P1_BASIC, "run_p1_basic", "P1 - BASIC TESTS"),
+    (TestLevel.P2_INTERMEDIATE, "run_p2_intermediate", "P2 - INTERMEDIATE TESTS"),
+    (TestLevel.P3_COMPREHENSIVE, "run_p3_comprehensive", "P3 - COMPREHENSIVE TESTS"),
+    (TestLevel.P4_EXHAUSTIVE, "run_p4_exhaustive", "P4 - EXHAUSTIVE TESTS"),
+)
+
 
 class TestBase(TestRunnerMixin):
     """Base class for CocoTB tests with verbosity control.
@@ -71,8 +82,15 @@ class TestBase(TestRunnerMixin):
         except KeyError:
             verbosity = VerbosityLevel.MINIMAL
 
+        # Stream results to TEST_RESULTS_FILE; with TEST_RERUN_FAILED=1, skip
+        # tests whose latest recorded outcome in that file is a pass
+        results_file = os.environ.get("TEST_RESULTS_FILE") or None
+        self._passed_previously = set()
+        if results_file and os.environ.get("TEST_RERUN_FAILED") == "1":
+            self._passed_previously = load_passed_tests(results_file)
+
         # Initialize the mixin
-        self._init_test_runner(verbosity)
+        self._init_test_runner(verbosity, results_file)
 
         # Get test level from environment (default: P1_BASIC)
         level_str = os.environ.get("TEST_LEVEL", "P1_BASIC")
@@ -96,6 +114,10 @@ class TestBase(TestRunnerMixin):
             test_name: Name of the test
             test_func: Async function to run
         """
+        if test_name in self._passed_previously:
+            self.log(f"SKIP (passed previously): {test_name}")
+            return
+
         self.log_test_start(test_name)
 
         try:
@@ -118,26 +140,19 @@ class TestBase(TestRunnerMixin):
         """Run all test phases up to the configured level.
 
         Override run_p1_basic, run_p2_intermediate, etc. in subclasses.
+        P1 always runs; each later phase runs if the level allows it.
         """
-        # Always run P1 (basic tests)
-        if hasattr(self, 'run_p1_basic'):
-            self.log_phase_start("P1 - BASIC TESTS")
-            await self.run_p1_basic()
-
-        # Run P2 if level >= P2
-        if self.should_run_level(TestLevel.P2_INTERMEDIATE) and hasattr(self, 'run_p2_intermediate'):
-            self.log_phase_start("P2 - INTERMEDIATE TESTS")
-            await self.run_p2_intermediate()
-
-        # Run P3 if level >= P3
-        if self.should_run_level(TestLevel.P3_COMPREHENSIVE) and hasattr(self, 'run_p3_comprehensive'):
-            self.log_phase_start("P3 - COMPREHENSIVE TESTS")
-            await self.run_p3_comprehensive()
-
-        # Run P4 if level >= P4
-        if self.should_run_level(TestLevel.P4_EXHAUSTIVE) and hasattr(self, 'run_p4_exhaustive'):
-            self.log_phase_start("P4 - EXHAUSTIVE TESTS")
-            await self.run_p4_exhaustive()
+        try:
+            for level, method_name, banner in _PHASES:
+                if not self.should_run_level(level):
+                    break
+                run_phase = getattr(self, method_name, None)
+                if run_phase is not None:
+                    self.log_phase_start(banner)
+                    await run_phase()
+        finally:
+            # A failing test re-raises, so close the results file either way
+            self.close_results()
 
         # Print summary
         self.log_summary()